@@ -4,23 +4,18 @@
             path/connectivity queries on a directed hypergraph.
 
 """
-try:
-    from queue import Queue
-except ImportError:
-    from Queue import Queue
+from collections import deque
+import heapq
+import itertools
 
 from halp.directed_hypergraph import DirectedHypergraph
-from halp.utilities.priority_queue import PriorityQueue
 
-# TODO-A: consider including target_node (with default value as None) in visit
-# and b-visit to allow for early stoppage in an is_connected check and in an
-# is_b_connected check
 # TODO-B: consider maybe also caching the results from one execution of
 # is_connected and is_b_connected to be able to check many node's for
 # connectivity in only a single call of either visit or b_visit
 
 
-def visit(H, source_node):
+def visit(H, source_node, target_node=None):
     """Executes the 'Visit' algorithm described in the paper:
     Giorgio Gallo, Giustino Longo, Stefano Pallottino, Sang Nguyen,
     Directed hypergraphs and applications, Discrete Applied Mathematics,
@@ -33,6 +28,9 @@ def visit(H, source_node):
 
     :param H: the hypergraph to perform the 'Visit' algorithm on.
     :param source_node: the initial node to begin traversal from.
+    :param target_node: [optional] node at which to stop the traversal;
+                    once it has been visited, the remaining nodes are
+                    left unexplored in the returned values.
     :returns: set -- nodes that were visited in this traversal.
               dict -- mapping from each node to the ID of the hyperedge that
               preceeded it in this traversal; will map a node to None
@@ -41,11 +39,21 @@ def visit(H, source_node):
               dict -- mapping from each hyperedge ID to the node that preceeded
               it in this traversal.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
+    :raises: ValueError -- No such node exists.
 
     """
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
+    # Checked up front since the traversal loop below may stop before
+    # ever looking up the source node (e.g., when it is the target node)
+    if not H.has_node(source_node):
+        raise ValueError("No such node exists.")
+
+    # Bind the accessors used in the traversal loop to local names
+    forward_star = H.get_forward_star
+    hyperedge_head = H.get_hyperedge_head
+
     node_set = H.get_node_set()
     # Pv keeps track of the ID of the hyperedge that directely
     # preceeded each node in the traversal
@@ -57,25 +65,25 @@ def visit(H, source_node):
     Pe = {hyperedge_id: None for hyperedge_id in hyperedge_id_set}
 
     # Explicitly tracks the set of visited nodes
-    visited_nodes = set([source_node])
+    visited_nodes = {source_node}
 
-    Q = Queue()
-    Q.put(source_node)
+    Q = deque([source_node])
 
-    while not Q.empty():
-        current_node = Q.get()
+    # Stop early once the target node (if any) has been visited
+    while Q and target_node not in visited_nodes:
+        current_node = Q.popleft()
         # At current_node, we can traverse each hyperedge in its forward star
-        for hyperedge_id in H.get_forward_star(current_node):
+        for hyperedge_id in forward_star(current_node):
             if Pe[hyperedge_id] is not None:
                 continue
             Pe[hyperedge_id] = current_node
             # Traversing a hyperedge in current_node's forward star yields
             # the set of head nodes of the hyperedge; visit each head node
-            for head_node in H.get_hyperedge_head(hyperedge_id):
+            for head_node in hyperedge_head(hyperedge_id):
                 if head_node in visited_nodes:
                     continue
                 Pv[head_node] = hyperedge_id
-                Q.put(head_node)
+                Q.append(head_node)
                 visited_nodes.add(head_node)
 
     return visited_nodes, Pv, Pe
@@ -92,13 +100,57 @@ def is_connected(H, source_node, target_node):
     :param source_node: the node to check connectedness to.
     :param target_node: the node to check connectedness of.
     :returns: bool -- whether target_node can be visited from source_node.
+    :raises: TypeError -- Algorithm only applicable to directed hypergraphs
+    :raises: ValueError -- No such node exists.
 
     """
-    visited_nodes, Pv, Pe = visit(H, source_node)
-    return target_node in visited_nodes
-
+    if not isinstance(H, DirectedHypergraph):
+        raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-def _x_visit(H, source_node, b_visit):
+    if not H.has_node(source_node):
+        raise ValueError("No such node exists.")
+
+    if not H.has_node(target_node):
+        return False
+
+    # Since a hyperedge can be traversed once any node in its tail has been
+    # visited, connectedness can be searched for from both ends: forward
+    # from the source node through forward stars and heads, and backward
+    # from the target node through backward stars and tails. The smaller
+    # frontier is expanded a level at a time until the two searches meet,
+    # or until one of them runs out of nodes.
+    forward = ({source_node}, [source_node],
+               H.get_forward_star, H.get_hyperedge_head)
+    backward = ({target_node}, [target_node],
+                H.get_backward_star, H.get_hyperedge_tail)
+
+    if source_node in backward[0]:
+        return True
+
+    while forward[1] and backward[1]:
+        if len(forward[1]) <= len(backward[1]):
+            search, other_search = forward, backward
+        else:
+            search, other_search = backward, forward
+        visited_nodes, frontier, star, hyperedge_nodes = search
+        other_visited_nodes = other_search[0]
+
+        next_frontier = []
+        for node in frontier:
+            for hyperedge_id in star(node):
+                for next_node in hyperedge_nodes(hyperedge_id):
+                    if next_node in other_visited_nodes:
+                        return True
+                    if next_node not in visited_nodes:
+                        visited_nodes.add(next_node)
+                        next_frontier.append(next_node)
+        # Replace the frontier in place, so that the search tuple sees it
+        frontier[:] = next_frontier
+
+    return False
+
+
+def _x_visit(H, source_node, b_visit, target_node=None):
     """General form of the B-Visit algorithm, extended to also perform
     an implicit F-Visit if the b_visit flag is not set (providing better
     time/memory performance than explcitily taking the hypergraph's
@@ -110,6 +162,7 @@ def _x_visit(H, source_node, b_visit):
     :param source_node: the initial node to begin traversal from.
     :param b_visit: boolean flag representing whether a B-Visit should
                     be performed (vs an F-Visit).
+    :param target_node: [optional] node at which to stop the traversal.
     :returns: set -- nodes that were x-visited in this traversal.
               dict -- mapping from each node visited to the ID of the hyperedge
                     that preceeded it in this traversal.
@@ -118,11 +171,17 @@ def _x_visit(H, source_node, b_visit):
               dict -- mapping from each node to an integer representing the
                     cardinality of the path from the source node to that node.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
+    :raises: ValueError -- No such node exists.
 
     """
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
+    # Checked up front since the traversal loop below may stop before
+    # ever looking up the source node (e.g., when it is the target node)
+    if not H.has_node(source_node):
+        raise ValueError("No such node exists.")
+
     # If the b_visit flag is set, perform a traditional B-Visit
     if b_visit:
         forward_star = H.get_forward_star
@@ -152,42 +211,47 @@ def _x_visit(H, source_node, b_visit):
     Pe = {hyperedge_id: None for hyperedge_id in hyperedge_id_set}
 
     # k keeps track of how many nodes in the tail of each hyperedge are
-    # B-connected (when all nodes in a tail are B-connected, that hyperedge
-    # can then be traversed)
-    k = {hyperedge_id: 0 for hyperedge_id in hyperedge_id_set}
+    # not yet B-connected (when all nodes in a tail are B-connected, that
+    # hyperedge can then be traversed); counting down from the tail size
+    # means each tail only has to be retrieved once, up front
+    k = {hyperedge_id: len(hyperedge_tail(hyperedge_id))
+         for hyperedge_id in hyperedge_id_set}
 
     # Explicitly tracks the set of B-visited nodes
-    x_visited_nodes = set([source_node])
+    x_visited_nodes = {source_node}
 
-    Q = Queue()
-    Q.put(source_node)
+    Q = deque([source_node])
 
-    while not Q.empty():
-        current_node = Q.get()
+    # Stop early once the target node (if any) has been x-visited
+    while Q and target_node not in x_visited_nodes:
+        current_node = Q.popleft()
         # At current_node, we can traverse each hyperedge in its forward star
         for hyperedge_id in forward_star(current_node):
-            # Since we're arrived at a new node, we increment
+            # Since we're arrived at a new node, we decrement
             # k[hyperedge_id] to indicate that we've reached 1 new
             # node in this hyperedge's tail
-            k[hyperedge_id] += 1
+            k[hyperedge_id] -= 1
             # Traverse this hyperedge only when we have reached all the nodes
-            # in its tail (i.e., when k[hyperedge_id] == |T(hyperedge_id)|)
-            if k[hyperedge_id] == len(hyperedge_tail(hyperedge_id)):
+            # in its tail (i.e., when k[hyperedge_id] reaches 0)
+            if k[hyperedge_id] == 0:
                 Pe[hyperedge_id] = current_node
+                # Every head node reached through this hyperedge is one step
+                # further from the source node than current_node
+                head_cardinality = v[current_node] + 1
                 # Traversing the hyperedge yields the set of head nodes of
                 # the hyperedge; B-visit each head node
                 for head_node in hyperedge_head(hyperedge_id):
                     if head_node in x_visited_nodes:
                         continue
                     Pv[head_node] = hyperedge_id
-                    Q.put(head_node)
-                    v[head_node] = v[Pe[hyperedge_id]] + 1
+                    Q.append(head_node)
+                    v[head_node] = head_cardinality
                     x_visited_nodes.add(head_node)
 
     return x_visited_nodes, Pv, Pe, v
 
 
-def b_visit(H, source_node):
+def b_visit(H, source_node, target_node=None):
     """Executes the 'B-Visit' algorithm described in the paper:
     Giorgio Gallo, Giustino Longo, Stefano Pallottino, Sang Nguyen,
     Directed hypergraphs and applications, Discrete Applied Mathematics,
@@ -200,6 +264,9 @@ def b_visit(H, source_node):
 
     :param H: the hypergraph to perform the 'B-Visit' algorithm on.
     :param source_node: the initial node to begin traversal from.
+    :param target_node: [optional] node at which to stop the traversal;
+                    once it has been visited, the remaining nodes are
+                    left unexplored in the returned values.
     :returns: set -- nodes that were B-visited in this traversal.
               dict -- mapping from each node visited to the ID of the hyperedge
               that preceeded it in this traversal.
@@ -209,7 +276,7 @@ def b_visit(H, source_node):
               cardinality of the path from the source node to that node.
 
     """
-    return _x_visit(H, source_node, True)
+    return _x_visit(H, source_node, True, target_node)
 
 
 def is_b_connected(H, source_node, target_node):
@@ -230,11 +297,11 @@ def is_b_connected(H, source_node, target_node):
     :returns: bool -- whether target_node can be visited from source_node.
 
     """
-    b_visited_nodes, Pv, Pe, v = b_visit(H, source_node)
+    b_visited_nodes, Pv, Pe, v = b_visit(H, source_node, target_node)
     return target_node in b_visited_nodes
 
 
-def f_visit(H, source_node):
+def f_visit(H, source_node, target_node=None):
     """Executes the 'F-Visit' algorithm alluded to in the paper:
     Giorgio Gallo, Giustino Longo, Stefano Pallottino, Sang Nguyen,
     Directed hypergraphs and applications, Discrete Applied Mathematics,
@@ -248,6 +315,9 @@ def f_visit(H, source_node):
 
     :param H: the hypergraph to perform the 'F-Visit' algorithm on.
     :param source_node: the initial node to begin traversal from.
+    :param target_node: [optional] node at which to stop the traversal;
+                    once it has been visited, the remaining nodes are
+                    left unexplored in the returned values.
     :returns: set -- nodes that were F-visited in this traversal.
               dict -- mapping from each node to the ID of the hyperedge that
               preceeded it in this traversal.
@@ -257,7 +327,7 @@ def f_visit(H, source_node):
               cardinality of the path from the source node to that node.
 
     """
-    return _x_visit(H, source_node, False)
+    return _x_visit(H, source_node, False, target_node)
 
 
 def is_f_connected(H, source_node, target_node):
@@ -272,7 +342,7 @@ def is_f_connected(H, source_node, target_node):
     :returns: bool -- whether target_node can be visited from source_node.
 
     """
-    f_visited_nodes, Pv, Pe, v = f_visit(H, source_node)
+    f_visited_nodes, Pv, Pe, v = f_visit(H, source_node, target_node)
     return target_node in f_visited_nodes
 
 
@@ -317,7 +387,7 @@ def gap_function(tail_nodes, W):
 
 
 def _shortest_x_tree(H, source_node, b_tree,
-                     F=sum_function, valid_ordering=False):
+                     F=sum_function, valid_ordering=False, target_node=None):
     """General form of the Shorest B-Tree algorithm, extended to also
     perform the implicit Shortest F-Tree procedure if the b_tree flag is
     not set (providing better time/memory performance than explcitily taking
@@ -337,6 +407,7 @@ def _shortest_x_tree(H, source_node, b_tree,
             nodes in the tail of a hyperedge.
     :param valid_ordering: a boolean flag to signal whether or not a valid
                         ordering of the nodes should be returned.
+    :param target_node: [optional] node at which to stop the traversal.
     :returns:   dict -- mapping from each node to the ID of the hyperedge that
                      preceeded it in this traversal.
                 dict -- mapping from each node to the node's weight.
@@ -369,47 +440,70 @@ def _shortest_x_tree(H, source_node, b_tree,
     W = {node: float("inf") for node in node_set}
     W[source_node] = 0
 
+    # Every tail is retrieved (and copied) from H just once, up front
+    tails = {hyperedge_id: hyperedge_tail(hyperedge_id)
+             for hyperedge_id in hyperedge_ids}
+
     # k keeps track of how many nodes in the tail of each hyperedge are
-    # B-connected (when all nodes in a tail are B-connected, that hyperedge
-    # can then be traversed)
-    k = {hyperedge_id: 0 for hyperedge_id in hyperedge_ids}
+    # not yet B-connected (when all nodes in a tail are B-connected, that
+    # hyperedge can then be traversed); counting down from the tail size
+    # avoids measuring the tail every time one of its nodes is reached
+    k = {hyperedge_id: len(tail) for hyperedge_id, tail in tails.items()}
 
     # List of nodes removed from the priority queue in the order that
-    # they were removed
+    # they were removed. A node can appear more than once: with a weight
+    # function such as gap_function, a head node can get a smaller weight
+    # than a node that was already removed, which is then queued again
     ordering = []
 
-    Q = PriorityQueue()
-    Q.add_element(W[source_node], source_node)
-
-    while not Q.is_empty():
+    # Q is a binary heap of (weight, count, node) entries. Rather than
+    # decreasing a node's key in place, a new entry is pushed whenever its
+    # weight decreases, and the superseded entries are skipped when popped.
+    # count resolves orderings in the case of equal weights; a node keeps
+    # the count it was first queued with until it is popped.
+    counter = itertools.count(1)
+    queued_count = {source_node: next(counter)}
+    Q = [(W[source_node], queued_count[source_node], source_node)]
+
+    while Q:
+        weight, _, current_node = heapq.heappop(Q)
+        # Skip entries whose weight has since been decreased
+        if weight > W[current_node]:
+            continue
+        del queued_count[current_node]
         # At current_node, we can traverse each hyperedge in its forward star
-        current_node = Q.get_top_priority()
         ordering.append(current_node)
+        # Stop at the target; its weight is final once it is popped as long
+        # as F never yields a head weight below the popped node's weight
+        if current_node == target_node:
+            break
         for hyperedge_id in forward_star(current_node):
-            # Since we're arrived at a new node, we increment
+            # Since we're arrived at a new node, we decrement
             # k[hyperedge_id] to indicate that we've reached 1 new
             # node in this hyperedge's tail
-            k[hyperedge_id] += 1
+            k[hyperedge_id] -= 1
             # Traverse this hyperedge only when we have reached all the nodes
-            # in its tail (i.e., when k[hyperedge_id] == |T(hyperedge_id)|)
-            if k[hyperedge_id] == len(hyperedge_tail(hyperedge_id)):
-                f = F(hyperedge_tail(hyperedge_id), W)
+            # in its tail (i.e., when k[hyperedge_id] reaches 0)
+            if k[hyperedge_id] == 0:
+                # Every head node reached through this hyperedge gets the
+                # same new weight
+                head_weight = \
+                    hyperedge_weight(hyperedge_id) + F(tails[hyperedge_id], W)
                 # For each node in the head of the newly-traversed hyperedge,
                 # if the previous weight of the node is more than the new
                 # weight...
-                for head_node in \
-                    [node for node in hyperedge_head(hyperedge_id) if
-                     W[node] > hyperedge_weight(hyperedge_id) + f]:
+                for head_node in hyperedge_head(hyperedge_id):
+                    if W[head_node] <= head_weight:
+                        continue
                     # Update its weight to the new, smaller weight
-                    W[head_node] = hyperedge_weight(hyperedge_id) + f
+                    W[head_node] = head_weight
                     Pv[head_node] = hyperedge_id
-                    # If it's not already in the priority queue...
-                    if not Q.contains_element(head_node):
-                        # Add it to the priority queue
-                        Q.add_element(W[head_node], head_node)
-                    else:
-                        # Otherwise, decrease it's key in the priority queue
-                        Q.reprioritize(W[head_node], head_node)
+                    # (Re-)queue it with its new weight, assigning a new count
+                    # only if it isn't already in the queue
+                    count = queued_count.get(head_node)
+                    if count is None:
+                        count = queued_count[head_node] = next(counter)
+                    heapq.heappush(Q, (head_weight, count, head_node))
 
     if valid_ordering:
         return Pv, W, ordering
@@ -418,7 +512,7 @@ def _shortest_x_tree(H, source_node, b_tree,
 
 
 def shortest_b_tree(H, source_node,
-                    F=sum_function, valid_ordering=False):
+                    F=sum_function, valid_ordering=False, target_node=None):
     """Executes the Shortest B-Tree (SBT) algorithm described in the paper:
     Giorgio Gallo, Giustino Longo, Stefano Pallottino, Sang Nguyen,
     Directed hypergraphs and applications, Discrete Applied Mathematics,
@@ -437,6 +531,13 @@ def shortest_b_tree(H, source_node,
             nodes in the tail of a hyperedge.
     :param valid_ordering: a boolean flag to signal whether or not a valid
                         ordering of the nodes should be returned.
+    :param target_node: [optional] node at which to stop the traversal;
+                    the search ends once it is removed from the priority
+                    queue. For weight functions under which a head node
+                    never weighs less than the node being removed (e.g.,
+                    sum_function and distance_function), only the nodes
+                    ordered up to it are then guaranteed to have their
+                    final weights and predecessors.
     :returns:   dict -- mapping from each node to the ID of the hyperedge that
                 preceeded it in this traversal.
                 dict -- mapping from each node to the node's weight.
@@ -444,11 +545,12 @@ def shortest_b_tree(H, source_node,
                 ordering of the nodes.
 
     """
-    return _shortest_x_tree(H, source_node, True, F, valid_ordering)
+    return _shortest_x_tree(H, source_node, True, F, valid_ordering,
+                            target_node)
 
 
 def shortest_f_tree(H, source_node,
-                    F=sum_function, valid_ordering=False):
+                    F=sum_function, valid_ordering=False, target_node=None):
     """Executes the Shortest F-Tree algorithm, which is simply an execution
     of the Shorest B-Tree procedure from the source node on the hypergraph's
     symmetric image. Refer to 'shortest_b_tree's documentation for more
@@ -461,6 +563,13 @@ def shortest_f_tree(H, source_node,
             nodes in the tail of a hyperedge.
     :param valid_ordering: a boolean flag to signal whether or not a valid
                         ordering of the nodes should be returned.
+    :param target_node: [optional] node at which to stop the traversal;
+                    the search ends once it is removed from the priority
+                    queue. For weight functions under which a head node
+                    never weighs less than the node being removed (e.g.,
+                    sum_function and distance_function), only the nodes
+                    ordered up to it are then guaranteed to have their
+                    final weights and predecessors.
     :returns:   dict -- mapping from each node to the ID of the hyperedge that
                 preceeded it in this traversal.
                 dict -- mapping from each node to the node's weight.
@@ -468,7 +577,8 @@ def shortest_f_tree(H, source_node,
                 ordering of the nodes.
 
     """
-    return _shortest_x_tree(H, source_node, False, F, valid_ordering)
+    return _shortest_x_tree(H, source_node, False, F, valid_ordering,
+                            target_node)
 
 
 def get_hypertree_from_predecessors(H, Pv, source_node,
@@ -529,7 +639,8 @@ def get_hypertree_from_predecessors(H, Pv, source_node,
 
 
 def get_hyperpath_from_predecessors(H, Pv, source_node, destination_node,
-                                    node_weights=None, attr_name="weight"):
+                                    node_weights=None, attr_name="weight",
+                                    validate=True):
     """Gives the hyperpath (DirectedHypergraph) representing the shortest
     B-hyperpath from the source to the destination, given a predecessor
     function and source and destination nodes.
@@ -543,6 +654,9 @@ def get_hyperpath_from_predecessors(H, Pv, source_node, destination_node,
             preceeded it in the path.
     :param source_node: the source node of the path.
     :param destination_node: the destination node of the path.
+    :param validate: [optional] whether to check that Pv is a valid
+            predecessor function over H; callers passing a predecessor
+            function produced by shortest_b_tree on H may skip this.
     :returns: DirectedHypergraph -- shortest B-hyperpath from source_node to
             destination_node.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
@@ -555,37 +669,38 @@ def get_hyperpath_from_predecessors(H, Pv, source_node, destination_node,
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    # Check that Pv is a valid predecessor function:
-    # - keys must be nodes in H mapping to hyperedges in H
-    # - exactly one node must map to None (i.e., only one node
-    #   without predecessor)
-    nodes_without_predecessor = 0
-    for node, hyperedge_id in Pv.items():
-        if not H.has_node(node):
-            raise KeyError(
-                "Node key %s in predecessor is not in H" % node)
-
-        if hyperedge_id is None:
-            nodes_without_predecessor += 1
-        elif not H.has_hyperedge_id(hyperedge_id):
-            raise KeyError(
-                "Hyperedge key %s in predecessor is not in H" % hyperedge_id)
-
-    if nodes_without_predecessor > 1:
-        raise ValueError(
-            "Multiple nodes without predecessor. %s received" % Pv)
-    elif nodes_without_predecessor == 0:
-        raise ValueError(
-            "Hypertree does not have source node. %s received" % Pv)
+    if validate:
+        # Check that Pv is a valid predecessor function:
+        # - keys must be nodes in H mapping to hyperedges in H
+        # - exactly one node must map to None (i.e., only one node
+        #   without predecessor)
+        for node, hyperedge_id in Pv.items():
+            if not H.has_node(node):
+                raise KeyError(
+                    "Node key %s in predecessor is not in H" % node)
+            if hyperedge_id is not None and \
+                    not H.has_hyperedge_id(hyperedge_id):
+                raise KeyError(
+                    "Hyperedge key %s in predecessor is not in H" %
+                    hyperedge_id)
+
+        nodes_without_predecessor = \
+            sum(1 for hyperedge_id in Pv.values() if hyperedge_id is None)
+        if nodes_without_predecessor > 1:
+            raise ValueError(
+                "Multiple nodes without predecessor. %s received" % Pv)
+        elif nodes_without_predecessor == 0:
+            raise ValueError(
+                "Hypertree does not have source node. %s received" % Pv)
 
     path = DirectedHypergraph()
 
     # keep track of which nodes are or have been processed
     processedOrInQueue = {n: False for n in Pv}
-    nodesToProcess = [destination_node]
+    nodesToProcess = deque([destination_node])
     processedOrInQueue[destination_node] = True
     while nodesToProcess:
-        node = nodesToProcess.pop(0)
+        node = nodesToProcess.popleft()
         hyperedge_id = Pv[node]
         if hyperedge_id:
             for n in H.get_hyperedge_tail(hyperedge_id):
@@ -53,7 +53,7 @@ def stationary_distribution(H, pi=None, P=None):
                                        nodes_to_indices,
                                        hyperedge_ids_to_indices)
 
-    node_count = len(H.get_node_set())
+    node_count = H.number_of_nodes()
     if pi is None:
         pi = _create_random_starter(node_count)
     pi_star = _create_random_starter(node_count)
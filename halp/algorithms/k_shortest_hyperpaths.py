@@ -7,6 +7,9 @@ __version__ = '0.1.0'
 __author__ = 'Jose Cadena'
 __email__ = 'jcadena@vbi.vt.edu'
 
+import heapq
+import itertools
+
 from halp.directed_hypergraph import DirectedHypergraph
 from halp.algorithms.directed_paths import sum_function, shortest_b_tree
 from halp.algorithms.directed_paths import get_hyperpath_from_predecessors
@@ -65,12 +68,16 @@ def k_shortest_hyperpaths(H, source_node, destination_node, k, F=sum_function):
     # Container for the k-shortest hyperpaths
     paths = []
 
-    # Container for the candidate paths. Every item is a 4-tuple:
+    # Container for the candidate paths: a binary heap of
+    # (lower bound, count, candidate) entries, where count resolves orderings
+    # in the case of equal bounds (so that candidates are never compared).
+    # Every candidate is a 4-tuple:
     # 1) subgraph H'
     # 2) lower bound on shortest hyperpath weight
     # 3) predecessor function of shortest hypertree rootes at s on H'
     # 4) valid ordering of the nodes in H'
     candidates = []
+    counter = itertools.count()
 
     shortest_hypertree, W, ordering = \
         shortest_b_tree(H, source_node, F=F, valid_ordering=True)
@@ -78,21 +85,21 @@ def k_shortest_hyperpaths(H, source_node, destination_node, k, F=sum_function):
     # if there isn't the for loop below
     # will break immediately and the function returns an empty list
     if W[destination_node] != float('inf'):
-        candidates.append((H, W, shortest_hypertree, ordering))
+        heapq.heappush(candidates,
+                       (W[destination_node], next(counter),
+                        (H, W, shortest_hypertree, ordering)))
 
     i = 1
     while i <= k and candidates:
-        ind = candidates.index(
-            min(candidates, key=lambda x: x[1][destination_node]))
-        kShortest = candidates[ind]
+        _, count, kShortest = heapq.heappop(candidates)
         if kShortest[2]:
-            candidates.pop(ind)
+            pathPredecessor = _get_path_predecessors(kShortest[0],
+                                                     kShortest[2],
+                                                     destination_node)
             path = \
-                get_hyperpath_from_predecessors(kShortest[0], kShortest[2],
-                                                source_node, destination_node)
-            pathPredecessor = \
-                {node: edge for node, edge in kShortest[2].items()
-                 if node in path.get_node_set()}
+                get_hyperpath_from_predecessors(kShortest[0], pathPredecessor,
+                                                source_node, destination_node,
+                                                validate=False)
             pathOrdering = \
                 [node for node in kShortest[3] if node in pathPredecessor]
             paths.append(path)
@@ -101,6 +108,19 @@ def k_shortest_hyperpaths(H, source_node, destination_node, k, F=sum_function):
             if len(paths) == k:
                 break
 
+            # If the remaining hyperpaths needed are all complete candidates
+            # tied with this hyperpath's weight, then none of this hyperpath's
+            # branches can precede them, so skip the branching step
+            weight = kShortest[1][destination_node]
+            needed = k - len(paths)
+            if candidates and candidates[0][0] == weight and \
+                    len(candidates) >= needed and \
+                    all(bound == weight and candidate[2]
+                        for bound, _, candidate in
+                        heapq.nsmallest(needed, candidates)):
+                i += 1
+                continue
+
             branches = _branching_step(kShortest[0], pathPredecessor,
                                        pathOrdering)
             for j, branch in enumerate(branches):
@@ -108,21 +128,51 @@ def k_shortest_hyperpaths(H, source_node, destination_node, k, F=sum_function):
                                           pathOrdering, kShortest[1],
                                           destination_node, F)
                 if lb < float('inf'):
-                    candidates.append((branch,
-                                      {destination_node: lb},
-                                      None, None))
+                    heapq.heappush(candidates,
+                                   (lb, next(counter),
+                                    (branch, {destination_node: lb},
+                                     None, None)))
             i += 1
         else:
             # Compute shortest hypertree for kShortest[0] and exact bound
-            # reinsert into candidates
+            # reinsert into candidates (keeping the candidate's count), unless
+            # the branch turns out to have no s-t hyperpath at all
             H_sub = kShortest[0]
             tree_sub, W_sub, ordering_sub = \
-                shortest_b_tree(H_sub, source_node, valid_ordering=True)
-            candidates[ind] = (H_sub, W_sub, tree_sub, ordering_sub)
+                shortest_b_tree(H_sub, source_node, F=F, valid_ordering=True)
+            if W_sub[destination_node] != float('inf'):
+                heapq.heappush(candidates,
+                               (W_sub[destination_node], count,
+                                (H_sub, W_sub, tree_sub, ordering_sub)))
 
     return paths
 
 
+def _get_path_predecessors(H, predecessor, t):
+    """Restricts a predecessor function of a hypertree to the nodes of the
+    hyperpath that ends at t, by walking the hypertree backwards from t.
+
+    :param H: the hypergraph that the hypertree is in.
+    :param predecessor: predecessor function of the hypertree.
+    :param t: the destination node of the hyperpath.
+    :returns: dict -- mapping from each node in the hyperpath to the ID of
+            the hyperedge that preceeded it (None for the source node).
+
+    """
+    path_predecessor = {}
+    nodes_to_process = [t]
+    while nodes_to_process:
+        node = nodes_to_process.pop()
+        if node in path_predecessor:
+            continue
+        hyperedge_id = predecessor[node]
+        path_predecessor[node] = hyperedge_id
+        if hyperedge_id is not None:
+            nodes_to_process.extend(H.get_hyperedge_tail(hyperedge_id))
+
+    return path_predecessor
+
+
 def _branching_step(H, predecessor, ordering):
     """Performs the branching step of the k-shortest hyperpaths
     algorithm.
@@ -135,19 +185,80 @@ def _branching_step(H, predecessor, ordering):
 
     """
     branches = []
-    for i in range(len(ordering) - 1):
-        branch = H.copy()
-        for j in range(i + 2, len(ordering)):
-            node = ordering[j]
-            for hyperedge in branch.get_backward_star(node):
-                if hyperedge != predecessor[node]:
-                    branch.remove_hyperedge(hyperedge)
+    # Branch i excludes every hyperedge into ordering[j] (j >= i + 2) other
+    # than that node's predecessor: exactly what branch i + 1 excludes, plus
+    # the hyperedges into ordering[i + 2]. So the branches are built from
+    # the last to the first, applying each node's exclusions only once to a
+    # single working copy of H (which shares H's attribute dicts, as the
+    # branches are only read from) and copying it for every branch
+    base = H._copy_structure()
+    for i in range(len(ordering) - 2, -1, -1):
+        if i + 2 < len(ordering):
+            node = ordering[i + 2]
+            excluded = base.get_backward_star(node)
+            excluded.discard(predecessor[node])
+            base.remove_hyperedges(excluded)
+        branch = base._copy_structure()
         branch.remove_hyperedge(predecessor[ordering[i + 1]])
         branches.append(branch)
+    branches.reverse()
 
     return branches
 
 
+class _WeightOverlay(dict):
+    """Node weighting function that holds updated weights for a few nodes
+    and looks up the weights of every other node in an underlying weighting
+    function.
+
+    """
+
+    def __init__(self, W):
+        """
+        Constructor for the _WeightOverlay class.
+
+        :param W: the underlying node weighting function.
+
+        """
+        dict.__init__(self)
+        self.W = W
+
+    # Every read falls back to the underlying weighting function, so that a
+    # user-supplied weight function sees the full set of node weights however
+    # it chooses to look them up
+
+    def __missing__(self, node):
+        return self.W[node]
+
+    def __contains__(self, node):
+        return dict.__contains__(self, node) or node in self.W
+
+    def __iter__(self):
+        for node in self.W:
+            yield node
+        for node in dict.__iter__(self):
+            if node not in self.W:
+                yield node
+
+    def __len__(self):
+        return len(self.W) + \
+            sum(1 for node in dict.__iter__(self) if node not in self.W)
+
+    def get(self, node, default=None):
+        if dict.__contains__(self, node):
+            return dict.__getitem__(self, node)
+        return self.W.get(node, default)
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[node] for node in self]
+
+    def items(self):
+        return [(node, self[node]) for node in self]
+
+
 def _compute_lower_bound(H_i, i, predecessor, ordering,
                          W, t, F=sum_function):
     """Computes a lower bound on the weight of the
@@ -167,8 +278,10 @@ def _compute_lower_bound(H_i, i, predecessor, ordering,
             weight of the shortest s-t hyperpath in H.
 
     """
-    # Initialize the weight vector for the nodes in the branched graph
-    W_bar = {node: weight for node, weight in W.items()}
+    # Initialize the weight vector for the nodes in the branched graph; only
+    # the nodes ordering[i + 1:] are reweighted, so rather than copying all
+    # of W, their weights go in an overlay that falls back to W
+    W_bar = _WeightOverlay(W)
     backstar = H_i.get_backward_star(ordering[i + 1])
 
     # There is no s-t path left in this branch
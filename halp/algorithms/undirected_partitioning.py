@@ -106,7 +106,7 @@ def _compute_normalized_laplacian(H,
 
     theta = D_v_sqrt_inv * M * W * D_e_inv * M_trans * D_v_sqrt_inv
 
-    node_count = len(H.get_node_set())
+    node_count = H.number_of_nodes()
     I = sparse.eye(node_count)
 
     delta = I - theta
@@ -141,7 +141,7 @@ def stationary_distribution(H, pi=None, P=None):
                                        nodes_to_indices,
                                        hyperedge_ids_to_indices)
 
-    node_count = len(H.get_node_set())
+    node_count = H.number_of_nodes()
     if pi is None:
         pi = _create_random_starter(node_count)
     pi_star = _create_random_starter(node_count)
@@ -8,6 +8,8 @@
 
 import copy
 
+from halp.utilities.attributes import copy_attribute
+
 
 class DirectedHypergraph(object):
     """
@@ -55,6 +57,12 @@ class DirectedHypergraph(object):
 
     """
 
+    # The instance only ever holds the structures created in __init__, so
+    # they are kept in slots rather than in a per-instance __dict__
+    __slots__ = ("_node_attributes", "_hyperedge_attributes",
+                 "_forward_star", "_backward_star",
+                 "_successors", "_predecessors", "_current_hyperedge_id")
+
     def __init__(self):
         """Constructor for the DirectedHypergraph class.
         Initializes all internal data structures used for the rapid
@@ -166,6 +174,24 @@ class DirectedHypergraph(object):
         #
         self._current_hyperedge_id = 0
 
+    def __getstate__(self):
+        """Returns the state of the hypergraph for pickling; needed because
+        the class uses __slots__ rather than an instance __dict__.
+
+        :returns: dict -- maps each slot name to its value.
+
+        """
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        """Restores the state of the hypergraph when unpickling.
+
+        :param state: dict mapping each slot name to its value.
+
+        """
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
     def _combine_attribute_arguments(self, attr_dict, attr):
         """Combines attr_dict and attr dictionaries, by updating attr_dict
             with attr.
@@ -417,6 +443,15 @@ class DirectedHypergraph(object):
         """
         return iter(self._node_attributes)
 
+    def number_of_nodes(self):
+        """Returns the number of nodes that are currently in the hypergraph,
+        without materializing the node set.
+
+        :returns: int -- number of nodes currently in the hypergraph
+
+        """
+        return len(self._node_attributes)
+
     def get_node_attribute(self, node, attribute_name):
         """Given a node and the name of an attribute, get a copy
         of that node's attribute.
@@ -512,19 +547,31 @@ class DirectedHypergraph(object):
 
         is_new_hyperedge = not self.has_hyperedge(frozen_tail, frozen_head)
         if is_new_hyperedge:
-            # Add tail and head nodes to graph (if not already present)
-            self.add_nodes(frozen_head)
-            self.add_nodes(frozen_tail)
-
             # Create new hyperedge name to use as reference for that hyperedge
             hyperedge_id = self._assign_next_hyperedge_id()
 
-            # Add hyperedge to the forward-star and to the backward-star
-            # for each node in the tail and head sets, respectively
+            # For each node in the tail and head sets, add the node to the
+            # graph (if not already present) and add the hyperedge to the
+            # node's forward-star and backward-star, respectively; only
+            # nodes that are actually new get an attribute dict and stars
+            # allocated
+            node_attributes = self._node_attributes
+            forward_star = self._forward_star
+            backward_star = self._backward_star
             for node in frozen_tail:
-                self._forward_star[node].add(hyperedge_id)
+                node_forward_star = forward_star.get(node)
+                if node_forward_star is None:
+                    node_attributes[node] = {}
+                    node_forward_star = forward_star[node] = set()
+                    backward_star[node] = set()
+                node_forward_star.add(hyperedge_id)
             for node in frozen_head:
-                self._backward_star[node].add(hyperedge_id)
+                node_backward_star = backward_star.get(node)
+                if node_backward_star is None:
+                    node_attributes[node] = {}
+                    forward_star[node] = set()
+                    node_backward_star = backward_star[node] = set()
+                node_backward_star.add(hyperedge_id)
 
             # Add the hyperedge as the successors and predecessors
             # of the tail set and head set, respectively
@@ -721,6 +768,15 @@ class DirectedHypergraph(object):
         """
         return iter(self._hyperedge_attributes)
 
+    def number_of_hyperedges(self):
+        """Returns the number of hyperedges that are currently in the
+        hypergraph, without materializing the hyperedge ID set.
+
+        :returns: int -- number of hyperedges currently in the hypergraph
+
+        """
+        return len(self._hyperedge_attributes)
+
     def get_hyperedge_id(self, tail, head):
         """From a tail and head set of nodes, returns the ID of the hyperedge
         that these sets comprise.
@@ -940,16 +996,20 @@ class DirectedHypergraph(object):
                 return False
         return True
 
-    def copy(self):
+    def copy(self, deep=False):
         """Creates a new DirectedHypergraph object with the same node and
         hyperedge structure.
         Copies of the nodes' and hyperedges' attributes are stored
         and used in the new hypergraph.
 
+        :param deep: if True, attribute values are copied recursively
+                    (via copy.deepcopy) rather than shallowly.
         :returns: DirectedHypergraph -- a new hypergraph that is a copy of
                 the current hypergraph
 
         """
+        if deep:
+            return copy.deepcopy(self)
         return self.__copy__()
 
     def __copy__(self):
@@ -964,51 +1024,76 @@ class DirectedHypergraph(object):
         """
         new_H = DirectedHypergraph()
 
-        # Loop over every node and its corresponding attribute dict
-        # in the original hypergraph's _node_attributes dict
-        for node, attr_dict in self._node_attributes.items():
-            # Create a new dict for that node to store that node's attributes
-            new_H._node_attributes[node] = {}
-            # Loop over each attribute of that node in the original hypergraph
-            # and, for each key, copy the corresponding value into the new
-            # hypergraph's dictionary using the same key
-            for attr_name, attr_value in attr_dict.items():
-                new_H._node_attributes[node][attr_name] = \
-                    copy.copy(attr_value)
-
-        # Loop over every hyperedge_id and its corresponding attribute dict
-        # in the original hypergraph's _hyperedge_attributes dict
-        for hyperedge_id, attr_dict in self._hyperedge_attributes.items():
-            # Create a new dict for that node to store that node's attributes
-            new_H._hyperedge_attributes[hyperedge_id] = {}
-            # Loop over each attribute of that hyperedge in the original
-            # hypergraph and, for each key, copy the corresponding value
-            # the new hypergraph's dictionary
-            for attr_name, attr_value in attr_dict.items():
-                new_H.\
-                    _hyperedge_attributes[hyperedge_id][attr_name] = \
-                    copy.copy(attr_value)
+        # Build a new attribute dict for every node and every hyperedge,
+        # copying each attribute value into it (immutable values are shared)
+        new_H._node_attributes = \
+            {node: {attr_name: copy_attribute(attr_value)
+                    for attr_name, attr_value in attr_dict.items()}
+             for node, attr_dict in self._node_attributes.items()}
+        new_H._hyperedge_attributes = \
+            {hyperedge_id: {attr_name: copy_attribute(attr_value)
+                            for attr_name, attr_value in attr_dict.items()}
+             for hyperedge_id, attr_dict in
+             self._hyperedge_attributes.items()}
 
         # Copy the original hypergraph's forward star and backward star
-        new_H._backward_star = self._backward_star.copy()
-        for node in self._node_attributes.keys():
-            new_H._backward_star[node] = \
-                self._backward_star[node].copy()
-            new_H._forward_star[node] = \
-                self._forward_star[node].copy()
+        new_H._forward_star = {node: star.copy() for node, star in
+                               self._forward_star.items()}
+        new_H._backward_star = {node: star.copy() for node, star in
+                                self._backward_star.items()}
 
         # Copy the original hypergraph's successors
-        for frozen_tail, successor_dict in self._successors.items():
-            new_H._successors[frozen_tail] = successor_dict.copy()
+        new_H._successors = {frozen_tail: successor_dict.copy()
+                             for frozen_tail, successor_dict in
+                             self._successors.items()}
         # Copy the original hypergraph's predecessors
-        for frozen_head, predecessor_dict in self._predecessors.items():
-            new_H._predecessors[frozen_head] = predecessor_dict.copy()
+        new_H._predecessors = {frozen_head: predecessor_dict.copy()
+                               for frozen_head, predecessor_dict in
+                               self._predecessors.items()}
 
         # Start assigning edge labels at the same
         new_H._current_hyperedge_id = self._current_hyperedge_id
 
         return new_H
 
+    def _copy_structure(self):
+        """Creates a new DirectedHypergraph object with the same node and
+        hyperedge structure, whose nodes' and hyperedges' attribute
+        dictionaries are shared with (rather than copied from) this
+        hypergraph.
+
+        :note: Intended for algorithms that derive many read-only
+            subhypergraphs by removing nodes or hyperedges; modifying an
+            attribute in either hypergraph also modifies it in the other.
+
+        :returns: DirectedHypergraph -- a new hypergraph with the same
+                structure as the current hypergraph
+
+        """
+        new_H = DirectedHypergraph()
+
+        # Only the outer attribute dicts are copied, so that nodes and
+        # hyperedges can be removed from the new hypergraph independently
+        new_H._node_attributes = self._node_attributes.copy()
+        new_H._hyperedge_attributes = self._hyperedge_attributes.copy()
+
+        # The stars, successors and predecessors are modified in place on
+        # removal, so they are copied as in __copy__
+        new_H._forward_star = {node: star.copy() for node, star in
+                               self._forward_star.items()}
+        new_H._backward_star = {node: star.copy() for node, star in
+                                self._backward_star.items()}
+        new_H._successors = {frozen_tail: successor_dict.copy()
+                             for frozen_tail, successor_dict in
+                             self._successors.items()}
+        new_H._predecessors = {frozen_head: predecessor_dict.copy()
+                               for frozen_head, predecessor_dict in
+                               self._predecessors.items()}
+
+        new_H._current_hyperedge_id = self._current_hyperedge_id
+
+        return new_H
+
     def get_symmetric_image(self):
         """Creates a new DirectedHypergraph object that is the symmetric
         image of this hypergraph (i.e., identical hypergraph with all
@@ -1080,36 +1165,35 @@ class DirectedHypergraph(object):
         nodes "x1" and "x2" to a head set containing nodes "x3", "x4", and "x5"
 
         """
-        in_file = open(file_name, 'r')
-
-        # Skip the header line
-        in_file.readline()
-
-        line_number = 2
-        for line in in_file.readlines():
-            line = line.strip()
-            # Skip empty lines
-            if not line:
-                continue
-
-            words = line.split(sep)
-            if not (2 <= len(words) <= 3):
-                raise \
-                    IOError("Line {} ".format(line_number) +
-                            "contains {} ".format(len(words)) +
-                            "columns -- must contain only 2 or 3.")
-
-            tail = set(words[0].split(delim))
-            head = set(words[1].split(delim))
-            if len(words) == 3:
-                weight = float(words[2].split(delim)[0])
-            else:
-                weight = 1
-            self.add_hyperedge(tail, head, weight=weight)
-
-            line_number += 1
-
-        in_file.close()
+        with open(file_name, 'r') as in_file:
+            # Skip the header line
+            in_file.readline()
+
+            # Iterate over the file object itself, so that lines are read
+            # through its buffer one at a time rather than all up front
+            line_number = 2
+            for line in in_file:
+                line = line.strip()
+                # Skip empty lines
+                if not line:
+                    continue
+
+                words = line.split(sep)
+                if not (2 <= len(words) <= 3):
+                    raise \
+                        IOError("Line {} ".format(line_number) +
+                                "contains {} ".format(len(words)) +
+                                "columns -- must contain only 2 or 3.")
+
+                tail = set(words[0].split(delim))
+                head = set(words[1].split(delim))
+                if len(words) == 3:
+                    weight = float(words[2].split(delim)[0])
+                else:
+                    weight = 1
+                self.add_hyperedge(tail, head, weight=weight)
+
+                line_number += 1
 
     # TODO: make writing more extensible (attributes, variable ordering, etc.)
     def write(self, file_name, delim=',', sep='\t'):
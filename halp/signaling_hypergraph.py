@@ -302,7 +302,7 @@ class SignalingHypergraph(object):
 
         self._node_attributes[node]["__in_hypernodes"].remove(hypernode)
 
-    def add_hypernode(self, hypernode, composing_nodes=set(), attr_dict=None, **attr):
+    def add_hypernode(self, hypernode, composing_nodes=None, attr_dict=None, **attr):
         """Adds a hypernode to the graph, along with any related attributes
            of the hypernode.
 
@@ -318,6 +318,10 @@ class SignalingHypergraph(object):
 
         """
         attr_dict = self._combine_attribute_arguments(attr_dict, attr)
+        # A fresh set per call; a set() default would be shared by (and
+        # stored in) every hypernode added without composing nodes
+        if composing_nodes is None:
+            composing_nodes = set()
 
         # If the hypernode hasn't previously been added, add it along
         # with its attributes
@@ -367,7 +371,7 @@ class SignalingHypergraph(object):
         return "e" + str(self._current_hyperedge_id)
 
     def add_hyperedge(self, tail, head,
-    				  pos_regs=set(), neg_regs=set(),
+    				  pos_regs=None, neg_regs=None,
     				  attr_dict=None, **attr):
         """Adds a hyperedge to the hypergraph, along with any related
         attributes of the hyperedge.
@@ -395,6 +399,10 @@ class SignalingHypergraph(object):
 
         """
         attr_dict = self._combine_attribute_arguments(attr_dict, attr)
+        if pos_regs is None:
+            pos_regs = set()
+        if neg_regs is None:
+            neg_regs = set()
 
         # Don't allow both empty tail and head containers (invalid hyperedge)
         if not tail and not head:
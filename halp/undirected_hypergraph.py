@@ -8,6 +8,8 @@
 
 import copy
 
+from halp.utilities.attributes import copy_attribute
+
 
 class UndirectedHypergraph(object):
     """
@@ -56,6 +58,11 @@ class UndirectedHypergraph(object):
 
     """
 
+    # The instance only ever holds the structures created in __init__, so
+    # they are kept in slots rather than in a per-instance __dict__
+    __slots__ = ("_node_attributes", "_hyperedge_attributes", "_star",
+                 "_node_set_to_hyperedge", "_current_hyperedge_id")
+
     def __init__(self):
         """
         Constructor for the UndirectedHypergraph class.
@@ -80,7 +87,8 @@ class UndirectedHypergraph(object):
         # the nodes of the hyperedge as specified by the user (as "nodes")
         # and the weight of the hyperedge (as "weight").
         # For internal purposes, it also stores the frozenset version of
-        # the nodes (as "__frozen_nodes").
+        # the nodes (as "__frozen_nodes"). If the user passed a frozenset,
+        # both entries refer to the same object.
         #
         # Provides O(1) time access to the attributes of a hyperedge.
         #
@@ -134,6 +142,24 @@ class UndirectedHypergraph(object):
         #
         self._current_hyperedge_id = 0
 
+    def __getstate__(self):
+        """Returns the state of the hypergraph for pickling; needed because
+        the class uses __slots__ rather than an instance __dict__.
+
+        :returns: dict -- maps each slot name to its value.
+
+        """
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        """Restores the state of the hypergraph when unpickling.
+
+        :param state: dict mapping each slot name to its value.
+
+        """
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
     def _combine_attribute_arguments(self, attr_dict, attr):
         # Note: Code & comments unchanged from DirectedHypergraph
         """Combines attr_dict and attr dictionaries, by updating attr_dict
@@ -199,14 +225,15 @@ class UndirectedHypergraph(object):
         """
         attr_dict = self._combine_attribute_arguments(attr_dict, attr)
 
+        node_attr_dict = self._node_attributes.get(node)
         # If the node hasn't previously been added, add it along
         # with its attributes
-        if not self.has_node(node):
+        if node_attr_dict is None:
             self._node_attributes[node] = attr_dict
             self._star[node] = set()
         # Otherwise, just update the node's attributes
         else:
-            self._node_attributes[node].update(attr_dict)
+            node_attr_dict.update(attr_dict)
 
     def add_nodes(self, nodes, attr_dict=None, **attr):
         # Note: Code & comments unchanged from DirectedHypergraph
@@ -239,6 +266,8 @@ class UndirectedHypergraph(object):
         """
         attr_dict = self._combine_attribute_arguments(attr_dict, attr)
 
+        node_attributes = self._node_attributes
+
         for node in nodes:
             # Note: This won't behave properly if the node is actually a tuple
             if type(node) is tuple:
@@ -249,9 +278,14 @@ class UndirectedHypergraph(object):
                 new_dict = attr_dict.copy()
                 new_dict.update(node_attr_dict)
                 self.add_node(new_node, new_dict)
-            else:
-                # See "A" in the documentation example
-                self.add_node(node, attr_dict.copy())
+            # See "A" in the documentation example; the work of add_node is
+            # done inline, so that the shared attributes are only copied
+            # for nodes that are actually new
+            elif node not in node_attributes:
+                node_attributes[node] = attr_dict.copy()
+                self._star[node] = set()
+            elif attr_dict:
+                node_attributes[node].update(attr_dict)
 
     def remove_node(self, node):
         """Removes a node and its attributes from the hypergraph. Removes
@@ -273,9 +307,15 @@ class UndirectedHypergraph(object):
 
         # Loop over every hyperedge in the star of the node;
         # i.e., over every hyperedge that contains the node
-        for hyperedge_id in self._star[node]:
+        star = self._star
+        for hyperedge_id in star[node]:
             frozen_nodes = \
                 self._hyperedge_attributes[hyperedge_id]["__frozen_nodes"]
+            # Remove this hyperedge from the stars of the other nodes in it,
+            # so that a later removal of those nodes doesn't revisit it
+            for other_node in frozen_nodes:
+                if other_node != node:
+                    star[other_node].discard(hyperedge_id)
             # Remove the node set composing the hyperedge
             del self._node_set_to_hyperedge[frozen_nodes]
             # Remove this hyperedge's attributes
@@ -333,6 +373,15 @@ class UndirectedHypergraph(object):
         """
         return iter(self._node_attributes)
 
+    def number_of_nodes(self):
+        """Returns the number of nodes that are currently in the hypergraph,
+        without materializing the node set.
+
+        :returns: int -- number of nodes currently in the hypergraph
+
+        """
+        return len(self._node_attributes)
+
     def get_node_attribute(self, node, attribute_name):
         # Note: Code and comments unchanged from DirectedHypergraph
         """Given a node and the name of an attribute, get a copy
@@ -351,8 +400,8 @@ class UndirectedHypergraph(object):
         elif attribute_name not in self._node_attributes[node]:
             raise ValueError("No such attribute exists.")
         else:
-            return copy.\
-                copy(self._node_attributes[node][attribute_name])
+            return copy_attribute(
+                self._node_attributes[node][attribute_name])
 
     def get_node_attributes(self, node):
         # Note: Code and comments unchanged from DirectedHypergraph
@@ -366,10 +415,9 @@ class UndirectedHypergraph(object):
         """
         if not self.has_node(node):
             raise ValueError("No such node exists.")
-        attributes = {}
-        for attr_name, attr_value in self._node_attributes[node].items():
-            attributes[attr_name] = copy.copy(attr_value)
-        return attributes
+        return {attr_name: copy_attribute(attr_value)
+                for attr_name, attr_value in
+                self._node_attributes[node].items()}
 
     def _assign_next_hyperedge_id(self):
         # Note: Code and comments unchanged from DirectedHypergraph
@@ -390,7 +438,8 @@ class UndirectedHypergraph(object):
             assigned the default value of 1.
 
         :param nodes: iterable container of references to nodes in the
-                    hyperedge to be added.
+                    hyperedge to be added; passing a frozenset avoids
+                    storing a second copy of the node set.
         :param attr_dict: dictionary of attributes of the hyperedge being
                         added.
         :param attr: keyword arguments of attributes of the hyperedge;
@@ -417,17 +466,25 @@ class UndirectedHypergraph(object):
         # Use frozensets for node sets to allow for hashable keys
         frozen_nodes = frozenset(nodes)
 
-        is_new_hyperedge = not self.has_hyperedge(frozen_nodes)
-        if is_new_hyperedge:
-            # Add nodes to graph (if not already present)
-            self.add_nodes(frozen_nodes)
-
+        # A single lookup both checks for an existing hyperedge and, if it
+        # exists, retrieves its ID so that its attributes can be updated
+        hyperedge_id = self._node_set_to_hyperedge.get(frozen_nodes)
+        if hyperedge_id is None:
             # Create new hyperedge name to use as reference for that hyperedge
             hyperedge_id = self._assign_next_hyperedge_id()
 
-            # For each node in the node set, add hyperedge to the node's star
+            # For each node in the node set, add the node to the graph (if
+            # not already present) and add the hyperedge to the node's star;
+            # only nodes that are actually new get an attribute dict and a
+            # star allocated
+            node_attributes = self._node_attributes
+            star = self._star
             for node in frozen_nodes:
-                self._star[node].add(hyperedge_id)
+                node_star = star.get(node)
+                if node_star is None:
+                    node_attributes[node] = {}
+                    node_star = star[node] = set()
+                node_star.add(hyperedge_id)
 
             # Add the hyperedge ID as the hyperedge that the node set composes
             self._node_set_to_hyperedge[frozen_nodes] = hyperedge_id
@@ -438,9 +495,6 @@ class UndirectedHypergraph(object):
             # user passed them into add_hyperedge.
             self._hyperedge_attributes[hyperedge_id] = \
                 {"nodes": nodes, "__frozen_nodes": frozen_nodes, "weight": 1}
-        else:
-            # If its not a new hyperedge, just get its ID to update attributes
-            hyperedge_id = self._node_set_to_hyperedge[frozen_nodes]
 
         # Set attributes and return hyperedge ID
         self._hyperedge_attributes[hyperedge_id].update(attr_dict)
@@ -478,10 +532,41 @@ class UndirectedHypergraph(object):
         """
         attr_dict = self._combine_attribute_arguments(attr_dict, attr)
 
+        # Bind the internal structures locally; the loop below performs the
+        # work of add_hyperedge inline to avoid its per-call overhead
+        node_attributes = self._node_attributes
+        hyperedge_attributes = self._hyperedge_attributes
+        star = self._star
+        node_set_to_hyperedge = self._node_set_to_hyperedge
+
         hyperedge_ids = []
 
         for nodes in hyperedges:
-            hyperedge_id = self.add_hyperedge(nodes, attr_dict.copy())
+            # Don't allow empty node set (invalid hyperedge)
+            if not nodes:
+                raise ValueError("nodes argument cannot be empty.")
+
+            frozen_nodes = frozenset(nodes)
+
+            hyperedge_id = node_set_to_hyperedge.get(frozen_nodes)
+            if hyperedge_id is None:
+                hyperedge_id = self._assign_next_hyperedge_id()
+
+                # Add any unseen nodes, and add the hyperedge to every
+                # node's star
+                for node in frozen_nodes:
+                    node_star = star.get(node)
+                    if node_star is None:
+                        node_attributes[node] = {}
+                        node_star = star[node] = set()
+                    node_star.add(hyperedge_id)
+
+                node_set_to_hyperedge[frozen_nodes] = hyperedge_id
+                hyperedge_attributes[hyperedge_id] = \
+                    {"nodes": nodes, "__frozen_nodes": frozen_nodes,
+                     "weight": 1}
+
+            hyperedge_attributes[hyperedge_id].update(attr_dict)
             hyperedge_ids.append(hyperedge_id)
 
         return hyperedge_ids
@@ -560,6 +645,57 @@ class UndirectedHypergraph(object):
         frozen_nodes = frozenset(nodes)
         return frozen_nodes in self._node_set_to_hyperedge
 
+    def has_subset_hyperedge(self, nodes):
+        """Given a set of nodes, returns whether there is a hyperedge in the
+        hypergraph that is composed only of nodes from that set.
+
+        :param nodes: iterable container of references to nodes.
+        :returns: bool -- true iff a hyperedge exists whose node set is a
+                subset of the specified nodes.
+        :raises: ValueError -- nodes argument cannot be empty.
+
+        """
+        frozen_nodes = frozenset(nodes)
+        if not frozen_nodes:
+            raise ValueError("nodes argument cannot be empty.")
+
+        # Any such hyperedge must be in the star of each of its nodes, so
+        # only the hyperedges in the stars of the given nodes are checked
+        checked = set()
+        for node in frozen_nodes:
+            for hyperedge_id in self._star.get(node, ()):
+                if hyperedge_id in checked:
+                    continue
+                checked.add(hyperedge_id)
+                if self._hyperedge_attributes[hyperedge_id][
+                        "__frozen_nodes"] <= frozen_nodes:
+                    return True
+        return False
+
+    def has_superset_hyperedge(self, nodes):
+        """Given a set of nodes, returns whether there is a hyperedge in the
+        hypergraph that contains all of those nodes.
+
+        :param nodes: iterable container of references to nodes.
+        :returns: bool -- true iff a hyperedge exists whose node set is a
+                superset of the specified nodes.
+        :raises: ValueError -- nodes argument cannot be empty.
+
+        """
+        frozen_nodes = frozenset(nodes)
+        if not frozen_nodes:
+            raise ValueError("nodes argument cannot be empty.")
+
+        # Such a hyperedge must be in the star of every given node, so
+        # intersect the stars, starting from the smallest one
+        stars = []
+        for node in frozen_nodes:
+            if node not in self._star:
+                return False
+            stars.append(self._star[node])
+        stars.sort(key=len)
+        return bool(stars[0].intersection(*stars[1:]))
+
     def has_hyperedge_id(self, hyperedge_id):
         # Note: Code and comments unchanged from DirectedHypergraph
         """Determines if a hyperedge referenced by hyperedge_id
@@ -589,6 +725,15 @@ class UndirectedHypergraph(object):
         """
         return iter(self._hyperedge_attributes)
 
+    def number_of_hyperedges(self):
+        """Returns the number of hyperedges that are currently in the
+        hypergraph, without materializing the hyperedge ID set.
+
+        :returns: int -- number of hyperedges currently in the hypergraph
+
+        """
+        return len(self._hyperedge_attributes)
+
     def get_hyperedge_id(self, nodes):
         """From a set of nodes, returns the ID of the hyperedge that this
         set comprises.
@@ -610,13 +755,11 @@ class UndirectedHypergraph(object):
             >>> x = H.get_hyperedge_id(["A", "B", "C"])
 
         """
-        frozen_nodes = frozenset(nodes)
-
-        if not self.has_hyperedge(frozen_nodes):
+        try:
+            return self._node_set_to_hyperedge[frozenset(nodes)]
+        except KeyError:
             raise ValueError("No such hyperedge exists.")
 
-        return self._node_set_to_hyperedge[frozen_nodes]
-
     def get_hyperedge_attribute(self, hyperedge_id, attribute_name):
         # Note: Code unchanged from DirectedHypergraph
         """Given a hyperedge ID and the name of an attribute, get a copy
@@ -645,8 +788,8 @@ class UndirectedHypergraph(object):
         elif attribute_name not in self._hyperedge_attributes[hyperedge_id]:
             raise ValueError("No such attribute exists.")
         else:
-            return copy.\
-                copy(self._hyperedge_attributes[hyperedge_id][attribute_name])
+            return copy_attribute(
+                self._hyperedge_attributes[hyperedge_id][attribute_name])
 
     def get_hyperedge_attributes(self, hyperedge_id):
         """Given a hyperedge ID, get a dictionary of copies of that hyperedge's
@@ -661,11 +804,9 @@ class UndirectedHypergraph(object):
         if not self.has_hyperedge_id(hyperedge_id):
             raise ValueError("No such hyperedge exists.")
         dict_to_copy = self._hyperedge_attributes[hyperedge_id].items()
-        attributes = {}
-        for attr_name, attr_value in dict_to_copy:
-            if attr_name != "__frozen_nodes":
-                attributes[attr_name] = copy.copy(attr_value)
-        return attributes
+        return {attr_name: copy_attribute(attr_value)
+                for attr_name, attr_value in dict_to_copy
+                if attr_name != "__frozen_nodes"}
 
     def get_hyperedge_nodes(self, hyperedge_id):
         """Given a hyperedge ID, get a copy of that hyperedge's nodes.
@@ -684,9 +825,15 @@ class UndirectedHypergraph(object):
         :param hyperedge: ID of the hyperedge to retrieve the weight from.
         :returns: int -- the weight of the hyperedge referenced as
                 hyperedge_id.
+        :raises: ValueError -- No such hyperedge exists.
 
         """
-        return self.get_hyperedge_attribute(hyperedge_id, "weight")
+        # Every hyperedge has a "weight" attribute (assigned a default on
+        # creation), so a single lookup suffices
+        try:
+            return self._hyperedge_attributes[hyperedge_id]["weight"]
+        except KeyError:
+            raise ValueError("No such hyperedge exists.")
 
     def get_star(self, node):
         """Given a node, get a copy of that node's star, that is, the set of
@@ -702,17 +849,51 @@ class UndirectedHypergraph(object):
             raise ValueError("No such node exists.")
         return self._star[node].copy()
 
-    def copy(self):
+    def star_iterator(self, node):
+        """Provides an iterator over a node's star, that is, the set of
+        hyperedges that the node belongs to, without copying it.
+        Unlike get_star, the hypergraph must not be modified while the
+        iterator is in use; use get_star when the hyperedges are to be
+        removed or added during iteration.
+
+        :param node: node to iterate over the star of.
+        :returns: iterator -- over the hyperedge_ids for the hyperedges
+                        in the node's star.
+        :raises: ValueError -- No such node exists.
+
+        """
+        if node not in self._node_attributes:
+            raise ValueError("No such node exists.")
+        return iter(self._star[node])
+
+    def get_star_size(self, node):
+        """Given a node, get the number of hyperedges that the node
+        belongs to, without copying its star.
+
+        :param node: node to retrieve the star size of.
+        :returns: int -- number of hyperedges in the node's star.
+        :raises: ValueError -- No such node exists.
+
+        """
+        if node not in self._node_attributes:
+            raise ValueError("No such node exists.")
+        return len(self._star[node])
+
+    def copy(self, deep=False):
         # Note: Code unchanged from DirectedHypergraph
         """Creates a new UndirectedHypergraph object with the same node and
         hyperedge structure.
         Copies of the nodes' and hyperedges' attributes are stored
         and used in the new hypergraph.
 
+        :param deep: if True, attribute values are copied recursively
+                    (via copy.deepcopy) rather than shallowly.
         :returns: UndirectedHypergraph -- a new hypergraph that is a copy of
                 the current hypergraph
 
         """
+        if deep:
+            return copy.deepcopy(self)
         return self.__copy__()
 
     def __copy__(self):
@@ -727,40 +908,24 @@ class UndirectedHypergraph(object):
         """
         new_H = UndirectedHypergraph()
 
-        # Loop over every node and its corresponding attribute dict
-        # in the original hypergraph's _node_attributes dict
-        for node, attr_dict in self._node_attributes.items():
-            # Create a new dict for that node to store that node's attributes
-            new_H._node_attributes[node] = {}
-            # Loop over each attribute of that node in the original hypergraph
-            # and, for each key, copy the corresponding value into the new
-            # hypergraph's dictionary using the same key
-            for attr_name, attr_value in attr_dict.items():
-                new_H._node_attributes[node][attr_name] = \
-                    copy.copy(attr_value)
-
-        # Loop over every hyperedge_id and its corresponding attribute dict
-        # in the original hypergraph's _hyperedge_attributes dict
-        for hyperedge_id, attr_dict in self._hyperedge_attributes.items():
-            # Create a new dict for that node to store that node's attributes
-            new_H._hyperedge_attributes[hyperedge_id] = {}
-            # Loop over each attribute of that hyperedge in the original
-            # hypergraph and, for each key, copy the corresponding value
-            # the new hypergraph's dictionary
-            for attr_name, attr_value in attr_dict.items():
-                new_H.\
-                    _hyperedge_attributes[hyperedge_id][attr_name] = \
-                    copy.copy(attr_value)
+        # Build a new attribute dict for every node and every hyperedge,
+        # copying each attribute value into it (immutable values are shared)
+        new_H._node_attributes = \
+            {node: {attr_name: copy_attribute(attr_value)
+                    for attr_name, attr_value in attr_dict.items()}
+             for node, attr_dict in self._node_attributes.items()}
+        new_H._hyperedge_attributes = \
+            {hyperedge_id: {attr_name: copy_attribute(attr_value)
+                            for attr_name, attr_value in attr_dict.items()}
+             for hyperedge_id, attr_dict in
+             self._hyperedge_attributes.items()}
 
         # Copy the original hypergraph's nodes' stars
-        new_H._star = self._star.copy()
-        for node in self._node_attributes.keys():
-            new_H._star[node] = self._star[node].copy()
+        new_H._star = {node: star.copy() for node, star in self._star.items()}
 
-        # Copy the original hypergraph's composed hyperedges
-        for frozen_nodes, hyperedge_id in self._node_set_to_hyperedge.items():
-            new_H._node_set_to_hyperedge[frozen_nodes] = \
-                copy.copy(hyperedge_id)
+        # Copy the original hypergraph's composed hyperedges; the hyperedge
+        # IDs are immutable, so the mapping itself can be copied in bulk
+        new_H._node_set_to_hyperedge = self._node_set_to_hyperedge.copy()
 
         # Start assigning edge labels at the same
         new_H._current_hyperedge_id = self._current_hyperedge_id
@@ -787,35 +952,34 @@ class UndirectedHypergraph(object):
         nodes "x1", "x2", "x3", and "x5".
 
         """
-        in_file = open(file_name, 'r')
-
-        # Skip the header line
-        in_file.readline()
-
-        line_number = 2
-        for line in in_file.readlines():
-            line = line.strip()
-            # Skip empty lines
-            if not line:
-                continue
-
-            words = line.split(sep)
-            if not (1 <= len(words) <= 2):
-                raise \
-                    IOError("Line {} ".format(line_number) +
-                            "contains {} ".format(len(words)) +
-                            "columns -- must contain only 1 or 2.")
-
-            nodes = set(words[0].split(delim))
-            if len(words) == 2:
-                weight = float(words[1].split(delim)[0])
-            else:
-                weight = 1
-            self.add_hyperedge(nodes, weight=weight)
-
-            line_number += 1
-
-        in_file.close()
+        with open(file_name, 'r') as in_file:
+            # Skip the header line
+            in_file.readline()
+
+            # Iterate over the file object itself, so that lines are read
+            # through its buffer one at a time rather than all up front
+            line_number = 2
+            for line in in_file:
+                line = line.strip()
+                # Skip empty lines
+                if not line:
+                    continue
+
+                words = line.split(sep)
+                if not (1 <= len(words) <= 2):
+                    raise \
+                        IOError("Line {} ".format(line_number) +
+                                "contains {} ".format(len(words)) +
+                                "columns -- must contain only 1 or 2.")
+
+                nodes = set(words[0].split(delim))
+                if len(words) == 2:
+                    weight = float(words[1].split(delim)[0])
+                else:
+                    weight = 1
+                self.add_hyperedge(nodes, weight=weight)
+
+                line_number += 1
 
     # TODO: make writing more extensible (attributes, variable ordering, etc.)
     def write(self, file_name, delim=',', sep='\t'):
@@ -842,17 +1006,11 @@ class UndirectedHypergraph(object):
         # write first header line
         out_file.write("nodes" + sep + "weight\n")
 
-        for hyperedge_id in self.get_hyperedge_id_set():
-            line = ""
-            # Write each node to the line, separated by delim
-            for node in self.get_hyperedge_nodes(hyperedge_id):
-                line += node + delim
-            # Remove last (extra) delim
-            line = line[:-1]
-
-            # Write the weight to the line and end the line
-            line += sep + str(self.get_hyperedge_weight(hyperedge_id)) + "\n"
-
-            out_file.write(line)
+        # Each line is the hyperedge's nodes, separated by delim, followed
+        # by the hyperedge's weight
+        out_file.writelines(
+            delim.join(self.get_hyperedge_nodes(hyperedge_id)) + sep +
+            str(self.get_hyperedge_weight(hyperedge_id)) + "\n"
+            for hyperedge_id in self.hyperedge_id_iterator())
 
         out_file.close()
@@ -0,0 +1,25 @@
+"""
+.. module:: attributes
+   :synopsis: Defines helpers for handing out the attribute values stored
+            in a hypergraph.
+
+"""
+import copy
+
+# Attribute values of these types cannot be mutated in place, so they can
+# be handed back to the caller directly rather than through copy.copy.
+IMMUTABLE_TYPES = (str, int, float, bool, complex, tuple, frozenset,
+                   bytes, type(None))
+
+
+def copy_attribute(value):
+    """Returns a copy of an attribute value; immutable values are returned
+    as-is, since a copy of them is indistinguishable from the original.
+
+    :param value: attribute value to be copied.
+    :returns: the value itself if it is immutable, otherwise a shallow copy.
+
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    return copy.copy(value)
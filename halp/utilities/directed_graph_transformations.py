@@ -31,15 +31,19 @@ def to_graph_decomposition(H):
 
     G = DirectedHypergraph()
 
-    nodes = [(node, H.get_node_attributes(node_attributes))
-             for node in G.node_iterator()]
+    nodes = [(node, H.get_node_attributes(node))
+             for node in H.node_iterator()]
     G.add_nodes(nodes)
 
-    edges = [([tail_node], [head_node])
-             for hyperedge_id in H.hyperedge_id_iterator()
-             for tail_node in H.get_hyperedge_tail(hyperedge_id)
-             for head_node in H.get_hyperedge_head(hyperedge_id)]
-    G.add_hyperedges(edges)
+    # A (tail node, head node) pair may be shared by several hyperedges;
+    # collect each distinct pair once (in order of first appearance) so
+    # that it is only added to G once
+    edges = dict.fromkeys((tail_node, head_node)
+                          for hyperedge_id in H.hyperedge_id_iterator()
+                          for tail_node in H.get_hyperedge_tail(hyperedge_id)
+                          for head_node in H.get_hyperedge_head(hyperedge_id))
+    G.add_hyperedges([([tail_node], [head_node])
+                      for tail_node, head_node in edges])
 
     return G
 
@@ -62,18 +66,22 @@ def to_networkx_digraph(H):
         raise TypeError("Transformation only applicable to \
                         directed hypergraphs")
 
-    G = to_graph_decomposition(H)
-
     nx_graph = nx.DiGraph()
 
-    for node in G.node_iterator():
-        nx_graph.add_node(node, **G.get_node_attributes(node))
-
-    for hyperedge_id in G.hyperedge_id_iterator():
-        tail_node = G.get_hyperedge_tail(hyperedge_id).pop()
-        head_node = G.get_hyperedge_head(hyperedge_id).pop()
-        edge_attributes = G.get_hyperedge_attributes(hyperedge_id)
-        nx_graph.add_edge(tail_node, head_node, **edge_attributes)
+    for node in H.node_iterator():
+        nx_graph.add_node(node, **H.get_node_attributes(node))
+
+    # Stream the edges of the graph decomposition straight from H rather
+    # than materializing it as a DirectedHypergraph first; each edge gets
+    # the attributes its single-node hyperedge would have in that
+    # decomposition
+    for hyperedge_id in H.hyperedge_id_iterator():
+        head = H.get_hyperedge_head(hyperedge_id)
+        for tail_node in H.get_hyperedge_tail(hyperedge_id):
+            for head_node in head:
+                nx_graph.add_edge(tail_node, head_node,
+                                  tail=[tail_node], head=[head_node],
+                                  weight=1)
 
     return nx_graph
 
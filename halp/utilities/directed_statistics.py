@@ -20,7 +20,7 @@ def number_of_nodes(H):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    return len(H.get_node_set())
+    return H.number_of_nodes()
 
 
 def number_of_hyperedges(H):
@@ -34,7 +34,7 @@ def number_of_hyperedges(H):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    return len(H.get_hyperedge_id_set())
+    return H.number_of_hyperedges()
 
 
 def _F_outdegree(H, F):
@@ -42,7 +42,8 @@ def _F_outdegree(H, F):
     in the hypergraph.
 
     :param H: the hypergraph whose outdegrees will be operated on.
-    :param F: function to execute on the list of outdegrees in the hypergraph.
+    :param F: function to execute on the array of outdegrees in the
+            hypergraph.
     :returns: result of the given function F.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
@@ -50,8 +51,8 @@ def _F_outdegree(H, F):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    return F([len(H.get_forward_star(node))
-             for node in H.get_node_set()])
+    return F(np.fromiter((len(H.get_forward_star(node))
+                          for node in H.node_iterator()), dtype=int))
 
 
 def outdegree_list(H):
@@ -65,7 +66,7 @@ def outdegree_list(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_outdegree(H, list)
+    return _F_outdegree(H, np.ndarray.tolist)
 
 
 def min_outdegree(H):
@@ -76,7 +77,7 @@ def min_outdegree(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_outdegree(H, min)
+    return int(_F_outdegree(H, np.min))
 
 
 def max_outdegree(H):
@@ -87,7 +88,7 @@ def max_outdegree(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_outdegree(H, max)
+    return int(_F_outdegree(H, np.max))
 
 
 def mean_outdegree(H):
@@ -107,7 +108,8 @@ def _F_indegree(H, F):
     in the hypergraph.
 
     :param H: the hypergraph whose indegrees will be operated on.
-    :param F: function to execute on the list of indegrees in the hypergraph.
+    :param F: function to execute on the array of indegrees in the
+            hypergraph.
     :returns: result of the given function F.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
@@ -115,8 +117,8 @@ def _F_indegree(H, F):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    return F([len(H.get_backward_star(node))
-             for node in H.get_node_set()])
+    return F(np.fromiter((len(H.get_backward_star(node))
+                          for node in H.node_iterator()), dtype=int))
 
 
 def indegree_list(H):
@@ -130,7 +132,7 @@ def indegree_list(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_indegree(H, list)
+    return _F_indegree(H, np.ndarray.tolist)
 
 
 def min_indegree(H):
@@ -141,7 +143,7 @@ def min_indegree(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_indegree(H, min)
+    return int(_F_indegree(H, np.min))
 
 
 def max_indegree(H):
@@ -152,7 +154,7 @@ def max_indegree(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_indegree(H, max)
+    return int(_F_indegree(H, np.max))
 
 
 def mean_indegree(H):
@@ -173,7 +175,7 @@ def _F_hyperedge_tail_cardinality(H, F):
 
     :param H: the hypergraph whose tail cardinalities will be
                     operated on.
-    :param F: function to execute on the set of cardinalities in the
+    :param F: function to execute on the array of cardinalities in the
             hypergraph.
     :returns: result of the given function F.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
@@ -182,8 +184,9 @@ def _F_hyperedge_tail_cardinality(H, F):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    return F([len(H.get_hyperedge_tail(hyperedge_id))
-             for hyperedge_id in H.get_hyperedge_id_set()])
+    return F(np.fromiter((len(H.get_hyperedge_tail(hyperedge_id))
+                          for hyperedge_id in H.hyperedge_id_iterator()),
+                         dtype=int))
 
 
 def hyperedge_tail_cardinality_list(H):
@@ -198,7 +201,7 @@ def hyperedge_tail_cardinality_list(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_tail_cardinality(H, list)
+    return _F_hyperedge_tail_cardinality(H, np.ndarray.tolist)
 
 
 def min_hyperedge_tail_cardinality(H):
@@ -210,7 +213,7 @@ def min_hyperedge_tail_cardinality(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_tail_cardinality(H, min)
+    return int(_F_hyperedge_tail_cardinality(H, np.min))
 
 
 def max_hyperedge_tail_cardinality(H):
@@ -222,7 +225,7 @@ def max_hyperedge_tail_cardinality(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_tail_cardinality(H, max)
+    return int(_F_hyperedge_tail_cardinality(H, np.max))
 
 
 def mean_hyperedge_tail_cardinality(H):
@@ -243,7 +246,7 @@ def _F_hyperedge_head_cardinality(H, F):
 
     :param H: the hypergraph whose head cardinalities will be
                     operated on.
-    :param F: function to execute on the set of cardinalities in the
+    :param F: function to execute on the array of cardinalities in the
             hypergraph.
     :returns: result of the given function F.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
@@ -252,8 +255,9 @@ def _F_hyperedge_head_cardinality(H, F):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    return F([len(H.get_hyperedge_head(hyperedge_id))
-             for hyperedge_id in H.get_hyperedge_id_set()])
+    return F(np.fromiter((len(H.get_hyperedge_head(hyperedge_id))
+                          for hyperedge_id in H.hyperedge_id_iterator()),
+                         dtype=int))
 
 
 def hyperedge_head_cardinality_list(H):
@@ -268,7 +272,7 @@ def hyperedge_head_cardinality_list(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_head_cardinality(H, list)
+    return _F_hyperedge_head_cardinality(H, np.ndarray.tolist)
 
 
 def max_hyperedge_head_cardinality(H):
@@ -281,7 +285,7 @@ def max_hyperedge_head_cardinality(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_head_cardinality(H, max)
+    return int(_F_hyperedge_head_cardinality(H, np.max))
 
 
 def min_hyperedge_head_cardinality(H):
@@ -293,7 +297,7 @@ def min_hyperedge_head_cardinality(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_head_cardinality(H, min)
+    return int(_F_hyperedge_head_cardinality(H, np.min))
 
 
 def mean_hyperedge_head_cardinality(H):
@@ -308,6 +312,19 @@ def mean_hyperedge_head_cardinality(H):
     return _F_hyperedge_head_cardinality(H, np.mean)
 
 
+def _hyperedge_cardinality_pairs(H):
+    """Yields a 2-tuple of (|tail|, |head|) for each hyperedge in the
+    hypergraph; the hypergraph's type is assumed to be already validated.
+
+    :param H: the directed hypergraph whose cardinalities will be yielded.
+    :returns: generator -- 2-tuples for each hyperedge's cardinality.
+
+    """
+    for hyperedge_id in H.hyperedge_id_iterator():
+        yield (len(H.get_hyperedge_tail(hyperedge_id)),
+               len(H.get_hyperedge_head(hyperedge_id)))
+
+
 def hyperedge_cardinality_pairs_list(H):
     """Returns a list of 2-tuples of (\|tail\|, \|head\|) for each hyperedge
     in the hypergraph.
@@ -321,9 +338,7 @@ def hyperedge_cardinality_pairs_list(H):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    return [(len(H.get_hyperedge_tail(hyperedge_id)),
-            len(H.get_hyperedge_head(hyperedge_id)))
-            for hyperedge_id in H.hyperedge_id_iterator()]
+    return list(_hyperedge_cardinality_pairs(H))
 
 
 def _F_hyperedge_cardinality_ratio(H, F):
@@ -333,8 +348,8 @@ def _F_hyperedge_cardinality_ratio(H, F):
 
     :param H: the hypergraph whose cardinality ratios will be
                     operated on.
-    :param F: function to execute on the set of cardinality ratios in the
-            hypergraph.
+    :param F: function to execute on the array of cardinality ratios in
+            the hypergraph.
     :returns: result of the given function F.
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
@@ -342,11 +357,50 @@ def _F_hyperedge_cardinality_ratio(H, F):
     if not isinstance(H, DirectedHypergraph):
         raise TypeError("Algorithm only applicable to directed hypergraphs")
 
-    # Since |head| can potentially be 0 (causing a division by 0 exception),
-    # we use numpy's float64 to have division by 0 result in inf, which is
-    # then cast back to a float for our final result
-    return F([float(tail_card / np.float64(head_card))
-             for tail_card, head_card in hyperedge_cardinality_pairs_list(H)])
+    # Divide all |tail|s by their |head|s in one vectorized operation. Since
+    # |head| can potentially be 0, we let numpy's float64 division result in
+    # inf (silencing its warning)
+    cardinality_pairs = \
+        np.array(list(_hyperedge_cardinality_pairs(H)), dtype=np.float64)
+    cardinality_pairs = cardinality_pairs.reshape(-1, 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = cardinality_pairs[:, 0] / cardinality_pairs[:, 1]
+    return F(ratios)
+
+
+def _hyperedge_cardinality_ratios(H):
+    """Yields the cardinality ratio |tail|/|head| of each hyperedge in the
+    hypergraph; the hypergraph's type is assumed to be already validated.
+
+    :param H: the directed hypergraph whose cardinality ratios will be
+            yielded.
+    :returns: generator -- cardinality ratio of each hyperedge.
+
+    """
+    # A hyperedge can't have both an empty tail and an empty head, so a
+    # |head| of 0 always corresponds to a ratio of inf
+    for tail_card, head_card in _hyperedge_cardinality_pairs(H):
+        if head_card:
+            yield tail_card / float(head_card)
+        else:
+            yield float("inf")
+
+
+def _reduce_hyperedge_cardinality_ratio(H, reducer):
+    """Returns the result of a reducer (such as min or max) that needs to see
+    each cardinality ratio only once, streaming the ratios rather than
+    materializing all of them first.
+
+    :param H: the hypergraph whose cardinality ratios will be reduced.
+    :param reducer: function to reduce the iterable of cardinality ratios.
+    :returns: result of the given reducer.
+    :raises: TypeError -- Algorithm only applicable to directed hypergraphs
+
+    """
+    if not isinstance(H, DirectedHypergraph):
+        raise TypeError("Algorithm only applicable to directed hypergraphs")
+
+    return reducer(_hyperedge_cardinality_ratios(H))
 
 
 def hyperedge_cardinality_ratio_list(H):
@@ -361,7 +415,7 @@ def hyperedge_cardinality_ratio_list(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_cardinality_ratio(H, list)
+    return _F_hyperedge_cardinality_ratio(H, np.ndarray.tolist)
 
 
 def min_hyperedge_cardinality_ratio(H):
@@ -373,7 +427,7 @@ def min_hyperedge_cardinality_ratio(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_cardinality_ratio(H, min)
+    return _reduce_hyperedge_cardinality_ratio(H, min)
 
 
 def max_hyperedge_cardinality_ratio(H):
@@ -385,7 +439,7 @@ def max_hyperedge_cardinality_ratio(H):
     :raises: TypeError -- Algorithm only applicable to directed hypergraphs
 
     """
-    return _F_hyperedge_cardinality_ratio(H, max)
+    return _reduce_hyperedge_cardinality_ratio(H, max)
 
 
 def mean_hyperedge_cardinality_ratio(H):
@@ -0,0 +1,48 @@
+"""
+.. module:: matrices
+   :synopsis: Provides matrix constructions shared by the directed and
+            undirected matrix representations of a hypergraph.
+"""
+import numpy as np
+from scipy import sparse
+
+
+def build_incidence_matrix(nodes_to_indices, hyperedge_ids_to_indices,
+                           get_hyperedge_nodes):
+    """Creates the incidence matrix between the nodes and the hyperedges of
+    a hypergraph, where the nodes of each hyperedge are given by
+    get_hyperedge_nodes (e.g., a directed hyperedge's tail or head, or an
+    undirected hyperedge's nodes).
+
+    :param nodes_to_indices: for each node, maps the node to its
+                            corresponding integer index.
+    :param hyperedge_ids_to_indices: for each hyperedge ID, maps the hyperedge
+                                    ID to its corresponding integer index.
+    :param get_hyperedge_nodes: function mapping a hyperedge ID to the
+                                nodes of that hyperedge to be included.
+    :returns: sparse.csc_matrix -- the incidence matrix as a sparse matrix.
+
+    """
+    hyperedge_count = len(hyperedge_ids_to_indices)
+    hyperedge_indices = np.empty(hyperedge_count, dtype=int)
+    hyperedge_nodes = []
+    for position, (hyperedge_id, hyperedge_index) in \
+            enumerate(hyperedge_ids_to_indices.items()):
+        hyperedge_indices[position] = hyperedge_index
+        hyperedge_nodes.append(get_hyperedge_nodes(hyperedge_id))
+
+    # Every node of a hyperedge contributes one entry to that hyperedge's
+    # column, so the column indices are the hyperedge indices repeated by
+    # the hyperedge sizes, and the row indices are the nodes' indices
+    sizes = np.fromiter((len(nodes) for nodes in hyperedge_nodes),
+                        dtype=int, count=hyperedge_count)
+    entry_count = int(sizes.sum())
+    cols = np.repeat(hyperedge_indices, sizes)
+    rows = np.fromiter((nodes_to_indices[node]
+                        for nodes in hyperedge_nodes for node in nodes),
+                       dtype=int, count=entry_count)
+    values = np.ones(entry_count, dtype=int)
+
+    return sparse.coo_matrix((values, (rows, cols)),
+                             shape=(len(nodes_to_indices),
+                                    hyperedge_count)).tocsc()
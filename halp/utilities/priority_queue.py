@@ -50,6 +50,25 @@ class PriorityQueue(object):
         entry = [priority, count, element]
         self.element_finder[element] = entry
         heapq.heappush(self.pq, entry)
+        # Reprioritized and deleted elements leave "marked-as-invalid"
+        # entries behind; rebuild the heap once they outnumber the rest
+        if len(self.pq) > 2 * max(16, len(self.element_finder)):
+            self._compact()
+
+    def _compact(self):
+        """Removes all "marked-as-invalid" entries from the priority queue
+        and restores the heap invariant.
+
+        """
+        valid_entries = []
+        for entry in self.pq:
+            if entry[1] != self.INVALID:
+                valid_entries.append(entry)
+            elif self.element_finder.get(entry[2]) is entry:
+                # A deleted element has no newer entry to fall back on
+                del self.element_finder[entry[2]]
+        heapq.heapify(valid_entries)
+        self.pq = valid_entries
 
     def get_top_priority(self):
         """Pops the element that has the top (smallest) priority.
@@ -105,8 +124,8 @@ class PriorityQueue(object):
         :returns: bool -- true iff element is in the priority queue.
 
         """
-        return (element in self.element_finder) and \
-            (self.element_finder[element][1] != self.INVALID)
+        entry = self.element_finder.get(element)
+        return entry is not None and entry[1] != self.INVALID
 
     def is_empty(self):
         """Determines if the priority queue has any elements.
@@ -119,7 +138,9 @@ class PriorityQueue(object):
             if self.pq[0][1] != self.INVALID:
                 return False
             else:
-                _, _, element = heapq.heappop(self.pq)
-                if element in self.element_finder:
-                    del self.element_finder[element]
+                entry = heapq.heappop(self.pq)
+                # A reprioritized element has a newer, valid entry; only
+                # forget the element if this was its current entry
+                if self.element_finder.get(entry[2]) is entry:
+                    del self.element_finder[entry[2]]
         return True
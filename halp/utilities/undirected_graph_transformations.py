@@ -6,6 +6,7 @@
 
 """
 import copy
+from itertools import combinations
 
 from halp.undirected_hypergraph import UndirectedHypergraph
 
@@ -30,17 +31,25 @@ def to_graph_decomposition(H):
 
     G = UndirectedHypergraph()
 
-    nodes = [(node, H.get_node_attributes(node_attributes))
-             for node in G.node_iterator()]
+    nodes = [(node, H.get_node_attributes(node))
+             for node in H.node_iterator()]
     G.add_nodes(nodes)
 
-    edges = [(node_a, node_b)
-             for hyperedge_id in H.hyperedge_id_iterator()
-             for node_a in H.get_hyperedge_nodes(hyperedge_id)
-             for node_b in H.get_hyperedge_nodes(hyperedge_id)
-             if node_a != node_b]
-
-    G.add_hyperedges(edges)
+    # Hyperedges are unordered, so each pair of nodes only needs to be
+    # emitted once per hyperedge; pairs shared by several hyperedges are
+    # also collapsed here (keeping the first occurrence), so that each
+    # edge is only passed to add_hyperedges once. A node repeated in the
+    # user's container must not be paired with itself.
+    get_hyperedge_nodes = H.get_hyperedge_nodes
+    edges = {}
+    for hyperedge_id in H.hyperedge_id_iterator():
+        for node_a, node_b in combinations(get_hyperedge_nodes(hyperedge_id),
+                                           2):
+            if node_a != node_b:
+                edges.setdefault(frozenset((node_a, node_b)),
+                                 (node_a, node_b))
+
+    G.add_hyperedges(edges.values())
 
     return G
 
@@ -63,17 +72,23 @@ def to_networkx_graph(H):
         raise TypeError("Transformation only applicable to \
                         undirected Hs")
 
-    G = to_graph_decomposition(H)
-
     nx_graph = nx.Graph()
 
-    for node in G.node_iterator():
-        nx_graph.add_node(node, **G.get_node_attributes(node))
-
-    for hyperedge_id in G.hyperedge_id_iterator():
-        edge_nodes = G.get_hyperedge_nodes(hyperedge_id)
-        edge_attributes = G.get_hyperedge_attributes(hyperedge_id)
-        nx_graph.add_edge(edge_nodes[0], edge_nodes[1], **edge_attributes)
+    for node in H.node_iterator():
+        nx_graph.add_node(node, **H.get_node_attributes(node))
+
+    # Stream the edges of the graph decomposition straight from H rather
+    # than materializing it as an UndirectedHypergraph first; each edge gets
+    # the attributes its two-node hyperedge would have in that decomposition,
+    # where a pair shared by several hyperedges keeps its first attributes
+    # and a node repeated in the user's container is not paired with itself
+    get_hyperedge_nodes = H.get_hyperedge_nodes
+    for hyperedge_id in H.hyperedge_id_iterator():
+        for node_a, node_b in combinations(get_hyperedge_nodes(hyperedge_id),
+                                           2):
+            if node_a != node_b and not nx_graph.has_edge(node_a, node_b):
+                nx_graph.add_edge(node_a, node_b,
+                                  nodes=(node_a, node_b), weight=1)
 
     return nx_graph
 
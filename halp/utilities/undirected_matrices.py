@@ -8,6 +8,7 @@ import numpy as np
 from scipy import sparse
 
 from halp.undirected_hypergraph import UndirectedHypergraph
+from halp.utilities.matrices import build_incidence_matrix
 
 
 def get_node_mapping(H):
@@ -19,14 +20,11 @@ def get_node_mapping(H):
               dict -- for each node, maps the node to the integer index.
 
     """
-    node_set = H.get_node_set()
     nodes_to_indices, indices_to_nodes = {}, {}
 
-    node_index = 0
-    for node in node_set:
-        nodes_to_indices.update({node: node_index})
-        indices_to_nodes.update({node_index: node})
-        node_index += 1
+    for node_index, node in enumerate(H.node_iterator()):
+        nodes_to_indices[node] = node_index
+        indices_to_nodes[node_index] = node
 
     return indices_to_nodes, nodes_to_indices
 
@@ -47,11 +45,10 @@ def get_hyperedge_id_mapping(H):
         raise TypeError("Algorithm only applicable to undirected hypergraphs")
 
     indices_to_hyperedge_ids, hyperedge_ids_to_indices = {}, {}
-    hyperedge_index = 0
-    for hyperedge_id in H.hyperedge_id_iterator():
-        hyperedge_ids_to_indices.update({hyperedge_id: hyperedge_index})
-        indices_to_hyperedge_ids.update({hyperedge_index: hyperedge_id})
-        hyperedge_index += 1
+    for hyperedge_index, hyperedge_id in \
+            enumerate(H.hyperedge_id_iterator()):
+        hyperedge_ids_to_indices[hyperedge_id] = hyperedge_index
+        indices_to_hyperedge_ids[hyperedge_index] = hyperedge_id
 
     return indices_to_hyperedge_ids, hyperedge_ids_to_indices
 
@@ -71,19 +68,9 @@ def get_incidence_matrix(H, nodes_to_indices, hyperedge_ids_to_indices):
     if not isinstance(H, UndirectedHypergraph):
         raise TypeError("Algorithm only applicable to undirected hypergraphs")
 
-    rows, cols = [], []
-    for hyperedge_id, hyperedge_index in hyperedge_ids_to_indices.items():
-        for node in H.get_hyperedge_nodes(hyperedge_id):
-            # get the mapping between the node and its ID
-            rows.append(nodes_to_indices.get(node))
-            cols.append(hyperedge_index)
-
-    values = np.ones(len(rows), dtype=int)
-    node_count = len(H.get_node_set())
-    hyperedge_count = len(H.get_hyperedge_id_set())
-
-    return sparse.csc_matrix((values, (rows, cols)),
-                             shape=(node_count, hyperedge_count))
+    return build_incidence_matrix(nodes_to_indices,
+                                  hyperedge_ids_to_indices,
+                                  H.get_hyperedge_nodes)
 
 
 def get_vertex_degree_matrix(M, W):
@@ -110,17 +97,14 @@ def get_hyperedge_weight_matrix(H, hyperedge_ids_to_indices):
             sparse matrix.
 
     """
-    # Combined 2 methods into 1; this could be written better
-    hyperedge_weights = {}
-    for hyperedge_id in H.hyperedge_id_iterator():
-        hyperedge_weights.update({hyperedge_ids_to_indices[hyperedge_id]:
-                                 H.get_hyperedge_weight(hyperedge_id)})
-
-    hyperedge_weight_vector = []
-    for i in range(len(hyperedge_weights.keys())):
-        hyperedge_weight_vector.append(hyperedge_weights.get(i))
+    # Place each hyperedge's weight directly at its index in the diagonal
+    hyperedge_weight_vector = np.empty(len(hyperedge_ids_to_indices),
+                                       dtype=float)
+    for hyperedge_id, hyperedge_index in hyperedge_ids_to_indices.items():
+        hyperedge_weight_vector[hyperedge_index] = \
+            H.get_hyperedge_weight(hyperedge_id)
 
-    return sparse.diags([hyperedge_weight_vector], [0])
+    return sparse.diags([hyperedge_weight_vector], [0], format="csc")
 
 
 def get_hyperedge_degree_matrix(M):
@@ -132,12 +116,9 @@ def get_hyperedge_degree_matrix(M):
             sparse matrix.
 
     """
-    degrees = M.sum(0).transpose()
-    new_degree = []
-    for degree in degrees:
-        new_degree.append(int(degree[0:]))
+    degrees = np.asarray(M.sum(0)).ravel()
 
-    return sparse.diags([new_degree], [0])
+    return sparse.diags([degrees], [0], format="csc", dtype=float)
 
 
 def fast_inverse(M):
@@ -148,9 +129,4 @@ def fast_inverse(M):
             sparse matrix.
 
     """
-    diags = M.diagonal()
-    new_diag = []
-    for value in diags:
-        new_diag.append(1.0/value)
-
-    return sparse.diags([new_diag], [0])
+    return sparse.diags([1.0 / M.diagonal()], [0], format="csc")
@@ -46,6 +46,36 @@ def test_is_connected():
     assert directed_paths.is_connected(H, 's', 'u')
     assert directed_paths.is_connected(H, 's', 'a')
     assert not directed_paths.is_connected(H, 's', 'b')
+    assert directed_paths.is_connected(H, 's', 's')
+    assert directed_paths.is_connected(H, 'a', 'u')
+    assert not directed_paths.is_connected(H, 'u', 's')
+    assert not directed_paths.is_connected(H, 's', 'c')
+
+    # Try an invalid hypergraph
+    try:
+        directed_paths.is_connected('s', 't', 'u')
+        assert False
+    except TypeError:
+        pass
+    except BaseException as e:
+        assert False, e
+
+    # Stopping at a target node only visits nodes reached before it
+    visited_nodes, Pv, Pe = directed_paths.visit(H, 's', 's')
+    assert visited_nodes == set(['s'])
+    assert Pe['e1'] is None
+    visited_nodes, Pv, Pe = directed_paths.visit(H, 's', 'x')
+    assert 'x' in visited_nodes
+    assert 'a' not in visited_nodes
+
+    # Try a source node that is not in the hypergraph
+    try:
+        directed_paths.is_connected(H, 'zzz', 'zzz')
+        assert False
+    except ValueError:
+        pass
+    except BaseException as e:
+        assert False, e
 
 
 def test_b_visit():
@@ -111,6 +141,21 @@ def test_is_b_connected():
     assert not directed_paths.is_b_connected(H, 's', 'a')
     assert not directed_paths.is_b_connected(H, 's', 'b')
 
+    # Stopping at a target node only B-visits nodes reached before it
+    b_visited_nodes, Pv, Pe, v = directed_paths.b_visit(H, 's', 'x')
+    assert 'x' in b_visited_nodes
+    assert 'u' not in b_visited_nodes
+    assert v['u'] == float("inf")
+
+    # Try a source node that is not in the hypergraph
+    try:
+        directed_paths.is_b_connected(H, 'zzz', 'zzz')
+        assert False
+    except ValueError:
+        pass
+    except BaseException as e:
+        assert False, e
+
 
 def test_f_visit():
     H = DirectedHypergraph()
@@ -169,6 +214,15 @@ def test_is_f_connected():
     assert not directed_paths.is_f_connected(H, 's', 'a')
     assert not directed_paths.is_f_connected(H, 's', 'b')
 
+    # Try a source node that is not in the hypergraph
+    try:
+        directed_paths.is_f_connected(H, 'zzz', 'zzz')
+        assert False
+    except ValueError:
+        pass
+    except BaseException as e:
+        assert False, e
+
 
 def test_shortest_sum_b_tree():
     H = DirectedHypergraph()
@@ -215,6 +269,16 @@ def test_shortest_sum_b_tree():
     assert W['a'] == float('inf')
     assert W['b'] == float('inf')
 
+    # Stop once y's weight is final
+    Pv, W, valid_ordering = \
+        directed_paths.shortest_b_tree(
+            H, 's', directed_paths.sum_function, True, 'y')
+
+    assert valid_ordering[-1] == 'y'
+    assert 't' not in valid_ordering
+    assert Pv['y'] == 'e2'
+    assert W['y'] == 2
+
     # Try an invalid hypergraph
     try:
         directed_paths.shortest_b_tree('s', 't')
@@ -275,6 +339,20 @@ def test_shortest_gap_b_tree():
     assert W['a'] == float('inf')
     assert W['b'] == float('inf')
 
+    # Under the gap function, a node that was already removed from the
+    # queue can get a smaller weight later, so it appears in the valid
+    # ordering again
+    H = DirectedHypergraph()
+    H.add_hyperedge(['s'], ['a'], weight=2)
+    H.add_hyperedge(['s'], ['b'], weight=3)
+    H.add_hyperedge(['s', 'b'], ['a'], weight=1)
+
+    Pv, W, valid_ordering = directed_paths.shortest_b_tree(
+        H, 's', directed_paths.gap_function, True)
+
+    assert valid_ordering == ['s', 'a', 'b', 'a']
+    assert W['a'] == 1
+
 
 def test_shortest_sum_f_tree():
     H = DirectedHypergraph()
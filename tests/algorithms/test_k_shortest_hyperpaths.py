@@ -140,6 +140,32 @@ class TestComputeLowerBound(unittest.TestCase):
         self.assertEqual(ksh._compute_lower_bound(
             H_2_1, 0, pred, ordering, W, 't'), 12)
 
+    def test_lower_bound_weight_function_sees_all_node_weights(self):
+        H_2 = self.nielsenGraph.copy()
+        e1 = H_2.get_hyperedge_id({'s'}, {'1'})
+        e2 = H_2.get_hyperedge_id({'1'}, {'2'})
+        e3 = H_2.get_hyperedge_id({'1', '2'}, {'t'})
+        H_2.remove_hyperedge(H_2.get_hyperedge_id({'s'}, {'2'}))
+        H_2.remove_hyperedge(H_2.get_hyperedge_id({'4'}, {'t'}))
+
+        W = {'s': 0, '1': 1, '2': 2, '3': 1, '4': 4, 't': 4}
+        pred = {'s': None, '1': e1, '2': e2, 't': e3}
+        ordering = ['s', '1', '2', 't']
+
+        H_2_1 = H_2.copy()
+        H_2_1.remove_hyperedge(
+            H_2_1.get_hyperedge_id({'s'}, {'1'}))
+
+        # A weight function that reads W through its other dict methods
+        def F(tail_nodes, W):
+            assert len(W) == 6
+            assert all(node in W for node in tail_nodes)
+            assert set(dict(W.items())) == set(W.keys())
+            return sum(W.get(node) for node in tail_nodes)
+
+        self.assertEqual(ksh._compute_lower_bound(
+            H_2_1, 0, pred, ordering, W, 't', F), 12)
+
 
 class TestKShortestHyperpaths(unittest.TestCase):
 
@@ -258,6 +284,36 @@ class TestKShortestHyperpaths(unittest.TestCase):
         output = ksh.k_shortest_hyperpaths(H, 's', 't', 1)
         self.assertEqual(output, [])
 
+    def test_returns_hyperpath_when_some_nodes_are_unreachable(self):
+        H = DirectedHypergraph()
+        H.add_node('s')
+        H.add_node('1')
+        H.add_node('2')
+        H.add_node('t')
+        H.add_hyperedge({'s'}, {'1'}, weight=1)
+        H.add_hyperedge({'1'}, {'t'}, weight=1)
+        H.add_hyperedge({'2'}, {'t'}, weight=1)
+
+        output = ksh.k_shortest_hyperpaths(H, 's', 't', 2)
+        self.assertEqual(len(output), 1)
+        self.assertEqual(output[0].get_node_set(), {'s', '1', 't'})
+
+    def test_returns_all_tied_hyperpaths(self):
+        H = DirectedHypergraph()
+        H.add_node('s')
+        H.add_node('t')
+        for node in ('1', '2', '3'):
+            H.add_hyperedge({'s'}, {node}, weight=1)
+            H.add_hyperedge({node}, {'t'}, weight=1)
+
+        output = ksh.k_shortest_hyperpaths(H, 's', 't', 3)
+        self.assertEqual(len(output), 3)
+        middle_nodes = set()
+        for hyperpath in output:
+            self.assertEqual(len(hyperpath.get_hyperedge_id_set()), 2)
+            middle_nodes |= hyperpath.get_node_set() - {'s', 't'}
+        self.assertEqual(middle_nodes, {'1', '2', '3'})
+
     def test_returns_3_shortest_hypergraphs_for_nielsen_example_with_k_equal_3(
             self):
         threeShortest = ksh.k_shortest_hyperpaths(
@@ -1,4 +1,5 @@
 from os import remove
+import pickle
 
 from halp.directed_hypergraph import DirectedHypergraph
 
@@ -682,6 +683,21 @@ def test_get_node_attributes():
         assert False, e
 
 
+def test_number_of_nodes_and_hyperedges():
+    H = DirectedHypergraph()
+    assert H.number_of_nodes() == 0
+    assert H.number_of_hyperedges() == 0
+
+    H.add_node('F')
+    H.add_hyperedges([(['A', 'B'], ['C']), (['A'], ['D'])])
+    assert H.number_of_nodes() == 5
+    assert H.number_of_hyperedges() == 2
+
+    H.remove_node('D')
+    assert H.number_of_nodes() == len(H.get_node_set())
+    assert H.number_of_hyperedges() == len(H.get_hyperedge_id_set())
+
+
 def test_get_forward_star():
     node_a = 'A'
     node_b = 'B'
@@ -881,6 +897,55 @@ def test_copy():
     assert new_H._successors == H._successors
     assert new_H._predecessors == H._predecessors
 
+    # A deep copy should also copy nested attribute values
+    H.add_node("A", members=[['x'], ['y']])
+    deep_H = H.copy(deep=True)
+    deep_H._node_attributes["A"]["members"][0].append('z')
+    assert H.get_node_attribute("A", "members") == [['x'], ['y']]
+    assert deep_H._forward_star == H._forward_star
+    assert deep_H._successors == H._successors
+
+
+def test_copy_structure():
+    H = DirectedHypergraph()
+    H.add_node("A", root=True)
+    hyperedge_ids = H.add_hyperedges([(set(['A', 'B']), set(['C'])),
+                                      (set(['C']), set(['D']))],
+                                     color='white')
+
+    new_H = H._copy_structure()
+
+    assert new_H._node_attributes == H._node_attributes
+    assert new_H._hyperedge_attributes == H._hyperedge_attributes
+    assert new_H._forward_star == H._forward_star
+    assert new_H._backward_star == H._backward_star
+    assert new_H._successors == H._successors
+    assert new_H._predecessors == H._predecessors
+
+    # Attribute dicts are shared, but the structure is independent
+    assert new_H._node_attributes["A"] is H._node_attributes["A"]
+    new_H.remove_hyperedge(hyperedge_ids[0])
+    assert H.has_hyperedge_id(hyperedge_ids[0])
+    assert hyperedge_ids[0] in H._forward_star['A']
+    assert H._successors[frozenset(['A', 'B'])]
+
+
+def test_pickle():
+    H = DirectedHypergraph()
+    H.add_node("A", root=True)
+    H.add_hyperedges([(set(['A', 'B']), set(['C'])), (set(['C']), set(['D']))],
+                     color='white')
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        new_H = pickle.loads(pickle.dumps(H, protocol))
+        assert new_H._node_attributes == H._node_attributes
+        assert new_H._hyperedge_attributes == H._hyperedge_attributes
+        assert new_H._forward_star == H._forward_star
+        assert new_H._backward_star == H._backward_star
+        assert new_H._successors == H._successors
+        assert new_H._predecessors == H._predecessors
+        assert new_H._current_hyperedge_id == H._current_hyperedge_id
+
 
 def test_read_and_write():
     # Try writing the following hypergraph to a file
@@ -928,6 +993,10 @@ def test_read_and_write():
         new_hyperedge_head = new_H.get_hyperedge_head(new_hyperedge_id)
         new_hyperedge_weight = new_H.get_hyperedge_weight(new_hyperedge_id)
 
+        # Tails and heads read from a file are (mutable) sets
+        assert type(new_hyperedge_tail) is set
+        assert type(new_hyperedge_head) is set
+
         found_matching_hyperedge = False
         for hyperedge_id in H.get_hyperedge_id_set():
             hyperedge_tail = H.get_hyperedge_tail(hyperedge_id)
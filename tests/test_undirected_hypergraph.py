@@ -1,4 +1,5 @@
 from os import remove
+import pickle
 
 from halp.undirected_hypergraph import UndirectedHypergraph
 
@@ -281,6 +282,11 @@ def test_remove_node():
     assert "e3" in H._hyperedge_attributes
     assert frozen_nodes3 in H._node_set_to_hyperedge
 
+    # Test that the removed hyperedges are gone from the remaining stars
+    assert H._star[node_b] == set()
+    assert H._star[node_c] == set()
+    assert H._star[node_d] == set(["e3"])
+
     try:
         H.remove_node(node_a)
         assert False
@@ -531,6 +537,12 @@ def test_get_node_attribute():
     assert H.get_node_attribute(node_c, 'alt_name') == 1337
     assert H.get_node_attribute(node_d, 'sink') is False
 
+    # Mutable attribute values should be returned as copies
+    H.add_node(node_a, members=['x', 'y'])
+    members = H.get_node_attribute(node_a, 'members')
+    members.append('z')
+    assert H.get_node_attribute(node_a, 'members') == ['x', 'y']
+
     # Try requesting an invalid node
     try:
         H.get_node_attribute("E", 'common')
@@ -578,6 +590,56 @@ def test_get_node_attributes():
         assert False, e
 
 
+def test_has_subset_and_superset_hyperedge():
+    H = UndirectedHypergraph()
+    H.add_hyperedges([set(['A', 'B', 'C']), set(['A', 'D'])])
+    H.add_node('F')
+
+    assert H.has_subset_hyperedge(['A', 'B', 'C'])
+    assert H.has_subset_hyperedge(['A', 'D', 'E'])
+    assert not H.has_subset_hyperedge(['B', 'C', 'D'])
+    assert not H.has_subset_hyperedge(['F', 'G'])
+
+    # Neither query accepts an empty node set, just as no hyperedge can
+    # have one
+    try:
+        H.has_subset_hyperedge([])
+        assert False
+    except ValueError:
+        pass
+    except BaseException as e:
+        assert False, e
+
+    assert H.has_superset_hyperedge(['A'])
+    assert H.has_superset_hyperedge(['B', 'C'])
+    assert not H.has_superset_hyperedge(['B', 'D'])
+    assert not H.has_superset_hyperedge(['F'])
+    assert not H.has_superset_hyperedge(['G'])
+
+    try:
+        H.has_superset_hyperedge([])
+        assert False
+    except ValueError:
+        pass
+    except BaseException as e:
+        assert False, e
+
+
+def test_number_of_nodes_and_hyperedges():
+    H = UndirectedHypergraph()
+    assert H.number_of_nodes() == 0
+    assert H.number_of_hyperedges() == 0
+
+    H.add_node('F')
+    H.add_hyperedges([set(['A', 'B', 'C']), set(['A', 'D'])])
+    assert H.number_of_nodes() == 5
+    assert H.number_of_hyperedges() == 2
+
+    H.remove_hyperedge('e1')
+    assert H.number_of_nodes() == len(H.get_node_set())
+    assert H.number_of_hyperedges() == len(H.get_hyperedge_id_set())
+
+
 def test_get_star():
     node_a = 'A'
     node_b = 'B'
@@ -608,6 +670,10 @@ def test_get_star():
     assert H.get_star(node_d) == set(['e2', 'e3'])
     assert H.get_star(node_e) == set(['e3'])
 
+    assert set(H.star_iterator(node_a)) == set(['e1', 'e2'])
+    assert H.get_star_size(node_a) == 2
+    assert H.get_star_size(node_e) == 1
+
     # Try requesting an invalid node
     try:
         H.get_star("F")
@@ -617,6 +683,22 @@ def test_get_star():
     except BaseException as e:
         assert False, e
 
+    try:
+        H.star_iterator("F")
+        assert False
+    except ValueError:
+        pass
+    except BaseException as e:
+        assert False, e
+
+    try:
+        H.get_star_size("F")
+        assert False
+    except ValueError:
+        pass
+    except BaseException as e:
+        assert False, e
+
 
 def test_copy():
     node_a = 'A'
@@ -650,6 +732,31 @@ def test_copy():
     assert new_H._star == H._star
     assert new_H._node_set_to_hyperedge == H._node_set_to_hyperedge
 
+    # Stars of the copy must not be shared with the original
+    new_H.remove_hyperedge(hyperedge_names[0])
+    assert hyperedge_names[0] in H._star[node_a]
+
+    # A deep copy should also copy nested attribute values
+    H.add_node("A", members=[['x'], ['y']])
+    deep_H = H.copy(deep=True)
+    deep_H._node_attributes["A"]["members"][0].append('z')
+    assert H.get_node_attribute("A", "members") == [['x'], ['y']]
+    assert deep_H._star == H._star
+
+
+def test_pickle():
+    H = UndirectedHypergraph()
+    H.add_node("A", root=True)
+    H.add_hyperedges([set(['A', 'B', 'C']), set(['A', 'D'])], color='white')
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        new_H = pickle.loads(pickle.dumps(H, protocol))
+        assert new_H._node_attributes == H._node_attributes
+        assert new_H._hyperedge_attributes == H._hyperedge_attributes
+        assert new_H._star == H._star
+        assert new_H._node_set_to_hyperedge == H._node_set_to_hyperedge
+        assert new_H._current_hyperedge_id == H._current_hyperedge_id
+
 
 def test_read_and_write():
     # Try writing the following hypergraph to a file
@@ -688,6 +795,9 @@ def test_read_and_write():
         new_hyperedge_nodes = new_H.get_hyperedge_nodes(new_hyperedge_id)
         new_hyperedge_weight = new_H.get_hyperedge_weight(new_hyperedge_id)
 
+        # Node sets read from a file are (mutable) sets
+        assert type(new_hyperedge_nodes) is set
+
         found_matching_hyperedge = False
         for hyperedge_id in H.get_hyperedge_id_set():
             hyperedge_nodes = H.get_hyperedge_nodes(hyperedge_id)
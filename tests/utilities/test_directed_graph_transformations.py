@@ -7,10 +7,15 @@ def test_to_graph_decomposition():
     H = DirectedHypergraph()
     H.read("tests/data/basic_directed_hypergraph.txt")
 
+    H.add_node("isolated", color="red")
+    H.add_node("s", label="start")
+
     G = directed_graph_transformations.to_graph_decomposition(H)
     G._check_consistency()
 
     assert G.get_node_set() == H.get_node_set()
+    assert G.get_node_attributes("isolated") == {"color": "red"}
+    assert G.get_node_attributes("s") == {"label": "start"}
 
     for hyperedge_id in G.hyperedge_id_iterator():
         tail_set = G.get_hyperedge_tail(hyperedge_id)
@@ -39,6 +39,7 @@ def test_max_outdegree():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.max_outdegree(H) == 4
+    assert type(directed_statistics.max_outdegree(H)) is int
 
     # Try counting an invalid directed hypergraph
     try:
@@ -55,6 +56,7 @@ def test_min_outdegree():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.min_outdegree(H) == 0
+    assert type(directed_statistics.min_outdegree(H)) is int
 
 
 def test_mean_outdegree():
@@ -81,6 +83,7 @@ def test_max_indegree():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.max_indegree(H) == 3
+    assert type(directed_statistics.max_indegree(H)) is int
 
     # Try counting an invalid directed hypergraph
     try:
@@ -97,6 +100,7 @@ def test_min_indegree():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.min_indegree(H) == 0
+    assert type(directed_statistics.min_indegree(H)) is int
 
 
 def test_mean_indegree():
@@ -123,6 +127,7 @@ def test_max_tail_cardinalitiy():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.max_hyperedge_tail_cardinality(H) == 3
+    assert type(directed_statistics.max_hyperedge_tail_cardinality(H)) is int
 
     # Try counting an invalid directed hypergraph
     try:
@@ -140,6 +145,7 @@ def test_min_tail_cardinalitiy():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.min_hyperedge_tail_cardinality(H) == 1
+    assert type(directed_statistics.min_hyperedge_tail_cardinality(H)) is int
 
 
 def test_mean_tail_cardinalitiy():
@@ -167,6 +173,7 @@ def test_max_head_cardinalitiy():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.max_hyperedge_head_cardinality(H) == 2
+    assert type(directed_statistics.max_hyperedge_head_cardinality(H)) is int
 
     # Try counting an invalid directed hypergraph
     try:
@@ -184,6 +191,7 @@ def test_min_head_cardinalitiy():
     H.read("tests/data/basic_directed_hypergraph.txt")
 
     assert directed_statistics.min_hyperedge_head_cardinality(H) == 1
+    assert type(directed_statistics.min_hyperedge_head_cardinality(H)) is int
 
 
 def test_mean_head_cardinalitiy():
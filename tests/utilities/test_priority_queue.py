@@ -51,6 +51,13 @@ def test_priority_queue():
     except BaseException as e:
         assert False, e
 
+    assert Q.contains_element("d")
+    Q.reprioritize(2, "e")
+    assert Q.get_top_priority() == "e"
+    assert Q.get_top_priority() == "c"
+    assert Q.get_top_priority() == "d"
+    assert Q.is_empty()
+
     Q = PriorityQueue()
 
     # Try invalid peek
@@ -70,3 +77,22 @@ def test_priority_queue():
         pass
     except BaseException as e:
         assert False, e
+
+
+def test_priority_queue_compaction():
+    Q = PriorityQueue()
+    Q.add_element(1, "a")
+    Q.add_element(2, "b")
+    Q.add_element(3, "c")
+    Q.delete_element("c")
+
+    # Repeated reprioritizations should not let invalid entries pile up
+    for priority in range(1000):
+        Q.reprioritize(priority + 5, "a")
+    assert len(Q.pq) <= 2 * 16 + 1
+    assert not Q.contains_element("c")
+    assert "c" not in Q.element_finder
+
+    assert Q.get_top_priority() == "b"
+    assert Q.get_top_priority() == "a"
+    assert Q.is_empty()
@@ -11,11 +11,32 @@ def test_to_graph_decomposition():
 
     assert G.get_node_set() == H.get_node_set()
 
+    for hyperedge_id in H.hyperedge_id_iterator():
+        hyperedge_nodes = list(H.get_hyperedge_nodes(hyperedge_id))
+        for i, node_a in enumerate(hyperedge_nodes):
+            for node_b in hyperedge_nodes[i + 1:]:
+                assert G.has_hyperedge((node_a, node_b))
+
     for hyperedge_id in G.hyperedge_id_iterator():
         hyperedge_nodes = G.get_hyperedge_nodes(hyperedge_id)
         assert len(hyperedge_nodes) == 2
         assert G.has_hyperedge((hyperedge_nodes[0], hyperedge_nodes[1]))
 
+    # Node attributes carry over, and a node repeated in a hyperedge's
+    # container is not paired with itself
+    H = UndirectedHypergraph()
+    H.add_node('a', color='red')
+    H.add_node('b', color='blue')
+    H.add_hyperedge(['a', 'a', 'b'])
+
+    G = undirected_graph_transformations.to_graph_decomposition(H)
+
+    assert G.get_node_attributes('a') == {'color': 'red'}
+    assert G.get_node_attributes('b') == {'color': 'blue'}
+    assert len(G.get_hyperedge_id_set()) == 1
+    assert G.has_hyperedge(('a', 'b'))
+    assert not G.has_hyperedge(('a', 'a'))
+
     # Try posting an invalid undirected hypergraph
     try:
         undirected_graph_transformations.to_graph_decomposition("invalid H")
@@ -51,6 +72,16 @@ def test_to_networkx_graph():
                     if G.has_edge(node_a, node_b):
                         assert False
 
+    # A node repeated in a hyperedge's container is not paired with itself
+    H = UndirectedHypergraph()
+    H.add_hyperedge(['a', 'a', 'b'])
+
+    G = undirected_graph_transformations.to_networkx_graph(H)
+
+    assert G.number_of_edges() == 1
+    assert G.has_edge('a', 'b')
+    assert not G.has_edge('a', 'a')
+
     # Try transforming an invalid undirected hypergraph
     try:
         undirected_graph_transformations.to_networkx_graph("invalid H")